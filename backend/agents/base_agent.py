@@ -13,11 +13,13 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
     List,
+    Mapping,
     Optional,
     Set,
     Union,
@@ -113,16 +115,17 @@ class A2AProtocol:
 
     async def get_messages_for_agent(self, agent_name: str) -> List[A2AMessage]:
         """Get pending messages for specific agent"""
-        messages = [msg for msg in self._message_queue if msg.to_agent == agent_name]
-        # Remove retrieved messages from queue
-        self._message_queue = [
-            msg for msg in self._message_queue if msg.to_agent != agent_name
-        ]
+        # Split the queue in one pass: retrieved messages vs. those left behind
+        messages: List[A2AMessage] = []
+        remaining: List[A2AMessage] = []
+        for msg in self._message_queue:
+            (messages if msg.to_agent == agent_name else remaining).append(msg)
+        self._message_queue = remaining
         return messages
 
-    def get_shared_context(self) -> Dict[str, Any]:
-        """Get shared context accessible to all agents"""
-        return self._context_store.copy()
+    def get_shared_context(self) -> Mapping[str, Any]:
+        """Get a read-only view of the context shared between agents"""
+        return MappingProxyType(self._context_store)
 
     def update_shared_context(self, key: str, value: Any):
         """Update shared context"""
@@ -188,8 +191,8 @@ class Agent(ABC):
         Execute agent with ADK lifecycle management
         Handles state transitions, error handling, and A2A communication
         """
-        execution_start = time.time()
-        execution_id = f"{self.name}_{int(execution_start)}"
+        execution_start = time.monotonic()
+        execution_id = f"{self.name}_{int(time.time())}"
 
         try:
             self.logger.info(
@@ -208,7 +211,7 @@ class Agent(ABC):
             result = await self.process(merged_context)
 
             # Update execution history
-            execution_time = time.time() - execution_start
+            execution_time = time.monotonic() - execution_start
             self._record_execution(execution_id, execution_time, result, None)
 
             self.state = AgentState.COMPLETED
@@ -222,7 +225,7 @@ class Agent(ABC):
             return result
 
         except Exception as e:
-            execution_time = time.time() - execution_start
+            execution_time = time.monotonic() - execution_start
             self._record_execution(execution_id, execution_time, None, str(e))
             self.state = AgentState.ERROR
             self.logger.error(f"❌ Agent {self.name} failed: {e}")
@@ -596,12 +599,6 @@ class AgentWorkflow:
                 for agent_name in STANDARD_AGENT_ORDER:
                     session_context.mark_agent_complete(agent_name)
 
-                # Increment cache hit count
-                content_hash = self.cache_service.generate_content_hash(
-                    session_context.raw_input, session_context.content_type
-                )
-                await self.cache_service.increment_hit_count(content_hash)
-
                 # Update session with cache hit info
                 if self.session_service:
                     await self.session_service.update_session(
@@ -632,7 +629,7 @@ class AgentWorkflow:
                 continue
 
             agent = self.agents[agent_name]
-            agent_start_time = time.time()
+            agent_start_time = time.monotonic()
 
             try:
                 logger.info(f"🔄 Executing agent: {agent_name}")
@@ -648,7 +645,7 @@ class AgentWorkflow:
 
                 # Execute agent
                 result = await agent.execute(context_dict)
-                agent_execution_time = time.time() - agent_start_time
+                agent_execution_time = time.monotonic() - agent_start_time
 
                 # Update SessionContext based on agent type and results
                 self._update_session_context_from_result(
@@ -677,7 +674,7 @@ class AgentWorkflow:
                 logger.info(f"✅ Agent {agent_name} completed successfully")
 
             except Exception as e:
-                agent_execution_time = time.time() - agent_start_time
+                agent_execution_time = time.monotonic() - agent_start_time
                 logger.error(f"❌ Agent {agent_name} failed: {e}")
                 session_context.add_error(agent_name, str(e))
 
@@ -721,9 +718,10 @@ class AgentWorkflow:
                 ],
             )
 
-        # Final persistence
+        # Final persistence (written now rather than after the save debounce)
         if self.persistence_service:
             await self.persistence_service.save_context(session_context)
+            await self.persistence_service.flush()
 
         # FR#029: Update final session status
         if self.session_service:
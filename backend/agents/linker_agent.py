@@ -74,7 +74,7 @@ Return a structured analysis of entities and their relationships.
         """
         Linker processing: identify entities and relationships
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         document = context.get("document", "")
         content_type = context.get("content_type", "document")
         shared_context = context.get("shared_context", {})
@@ -131,7 +131,7 @@ Return a structured analysis of entities and their relationships.
 
             # Emit completion event with metrics
             if self.event_emitter:
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 await self.event_emitter.emit_agent_complete(
                     agent_name="Linker",
                     payload={
@@ -97,7 +97,7 @@ class VisualizerAgent(Agent):
         Returns:
             Visualization data with nodes and edges
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         document = context.get("document", "")
         content_type = context.get(
             "content_type", "document"
@@ -141,7 +141,7 @@ class VisualizerAgent(Agent):
 
             # Emit completion event with metrics
             if self.event_emitter:
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 await self.event_emitter.emit_agent_complete(
                     agent_name="Visualizer",
                     payload={
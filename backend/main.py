@@ -4,14 +4,20 @@ Development server with hot-reload support
 Multi-agent system with ADK and A2A Protocol
 """
 
+import asyncio
 import importlib
+import json
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from contextlib import asynccontextmanager
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from backend.routes.prompt_routes import router as prompt_router
@@ -21,10 +27,84 @@ from backend.routes.stream_routes import router as stream_router
 
 logger = logging.getLogger(__name__)
 
+
+def _preload_clients() -> None:
+    """Build external clients and identities before the first request.
+
+    Client construction (credential discovery, channel setup) otherwise lands
+    on the first user request after a cold start. Failures are logged and left
+    to surface, as before, on the request that needs the client.
+    """
+    try:
+        from backend.services.firestore_client import get_firestore_client
+
+        # Reading the property builds the client
+        _ = get_firestore_client().client
+        logger.info("✅ Firestore client preloaded")
+    except Exception as e:
+        logger.warning(f"⚠️  Firestore client preload failed: {e}")
+
+    try:
+        from backend.services.gemini_client import get_gemini_client
+
+        get_gemini_client()
+        logger.info("✅ Gemini client preloaded")
+    except Exception as e:
+        logger.warning(f"⚠️  Gemini client preload failed: {e}")
+
+    # The service account identity comes from blocking metadata server calls;
+    # fetch it here, off the event loop, rather than inside the first request
+    # that builds an A2A protocol
+    if os.getenv("K_SERVICE"):
+        from backend.services.a2a_security import ServiceAccountIdentity
+
+        ServiceAccountIdentity.from_cloud_run_metadata()
+
+
+async def _close_clients() -> None:
+    """Flush buffered writes and release pooled connections at shutdown."""
+    from backend.services.a2a_security import close_security_service
+    from backend.services.context_persistence import get_persistence_service
+    from backend.services.gemini_client import get_gemini_client
+
+    # SessionContext saves are debounced; write any still pending
+    try:
+        if not await get_persistence_service().aclose():
+            logger.warning("⚠️  Pending SessionContext saves were not written")
+    except Exception as e:
+        logger.warning(f"⚠️  SessionContext flush failed: {e}")
+
+    # Security audit events are written by a background task; drain it
+    try:
+        await close_security_service()
+    except Exception as e:
+        logger.warning(f"⚠️  Security audit flush failed: {e}")
+
+    # Only close a client that was actually built; don't create one here
+    if not get_gemini_client.cache_info().currsize:
+        return
+    try:
+        await get_gemini_client().aclose()
+    except Exception as e:
+        logger.warning(f"⚠️  Gemini client close failed: {e}")
+    get_gemini_client.cache_clear()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: warm external clients on startup, close on exit."""
+    await asyncio.to_thread(_preload_clients)
+    yield
+    await _close_clients()
+
+
 app = FastAPI(
     title="Agentic Navigator API",
     description="Multi-agent knowledge exploration system",
     version="0.1.0",
+    # orjson serialises response bodies in C, notably faster than stdlib json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Security: Trusted Host Middleware (Cloud Run best practice)
@@ -90,6 +170,82 @@ app.include_router(stream_router)
 app.include_router(prompt_router)
 
 
+# Agent instances used by /healthz and /api/agents/status. These endpoints only
+# read agent metadata, so one set per process replaces constructing an A2A
+# protocol and every agent on each probe.
+_AGENT_CLASS_NAMES = {
+    "orchestrator": "OrchestratorAgent",
+    "summarizer": "SummarizerAgent",
+    "linker": "LinkerAgent",
+    "visualizer": "VisualizerAgent",
+}
+_probe_agents: Optional[Dict[str, Any]] = None
+
+# Outcome of importing the agents package, resolved once per process so probes
+# do not retry (and re-raise) a failing import on every request
+_agents_import: Optional[Tuple[Optional[ModuleType], Optional[ImportError]]] = None
+
+
+def _get_agents_module() -> Tuple[Optional[ModuleType], Optional[ImportError]]:
+    """
+    Import the ADK agents package once and cache the outcome
+
+    Returns:
+        Tuple of (agents module or None, last import error or None)
+    """
+    global _agents_import
+    if _agents_import is None:
+        agents_module = None
+        last_import_error = None
+
+        for module_name in ("backend.agents", "agents"):
+            try:
+                agents_module = importlib.import_module(module_name)
+                last_import_error = None
+                break
+            except ImportError as exc:
+                last_import_error = exc
+
+        _agents_import = (agents_module, last_import_error)
+
+    return _agents_import
+
+
+def _get_probe_agents(agents_module: ModuleType) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Get the shared probe agents, building them on first use
+
+    A partial build is returned but not cached, so transient initialization
+    failures are retried on the next call.
+
+    Args:
+        agents_module: Imported ADK agents module
+
+    Returns:
+        Tuple of (agents by name, initialization error messages)
+
+    Raises:
+        Exception: If the A2A Protocol itself cannot be initialized
+    """
+    global _probe_agents
+    if _probe_agents is not None:
+        return _probe_agents, []
+
+    a2a = agents_module.A2AProtocol()
+    agents: Dict[str, Any] = {}
+    errors: List[str] = []
+
+    for name, class_name in _AGENT_CLASS_NAMES.items():
+        try:
+            agents[name] = getattr(agents_module, class_name)(a2a)
+        except Exception as e:
+            errors.append(f"{name} agent initialization failed: {str(e)}")
+
+    if not errors:
+        _probe_agents = agents
+    return agents, errors
+
+
 class HealthResponse(BaseModel):
     status: str
     environment: str
@@ -98,10 +254,20 @@ class HealthResponse(BaseModel):
     errors: Optional[Dict[str, str]] = None
 
 
+# Healthy /healthz results are reused for this long, so frequent probes within
+# the window skip the dependency checks. Degraded results are never reused.
+HEALTHZ_CACHE_TTL_SECONDS = 2.0
+_healthz_cache: Optional[Tuple[float, HealthResponse]] = None
+
+# Static bodies are serialised once at import rather than on every request
+_ROOT_BODY = json.dumps({"message": "Agentic Navigator API", "version": "0.1.0"})
+_API_DOCS_BODY = json.dumps({"docs_url": "/docs"})
+
+
 @app.get("/", tags=["health"])
 async def root():
     """Root endpoint"""
-    return {"message": "Agentic Navigator API", "version": "0.1.0"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["health"], response_model=HealthResponse, deprecated=True)
@@ -125,6 +291,14 @@ async def healthz_check():
     - ADK agent system status
     - Firestore connectivity
     """
+    global _healthz_cache
+    now = time.monotonic()
+    if (
+        _healthz_cache is not None
+        and now - _healthz_cache[0] < HEALTHZ_CACHE_TTL_SECONDS
+    ):
+        return _healthz_cache[1]
+
     environment = os.getenv("ENVIRONMENT", "development")
     health_status = "healthy"
     adk_status = None
@@ -132,15 +306,7 @@ async def healthz_check():
     errors = {}
 
     # Check ADK System availability
-    agents_module = None
-    last_import_error = None
-
-    for module_name in ("backend.agents", "agents"):
-        try:
-            agents_module = importlib.import_module(module_name)
-            break
-        except ImportError as exc:
-            last_import_error = exc
+    agents_module, last_import_error = _get_agents_module()
 
     if agents_module is None:
         adk_status = "unavailable"
@@ -151,15 +317,9 @@ async def healthz_check():
 
     if adk_status is None and agents_module is not None:
         try:
-            OrchestratorAgent = getattr(agents_module, "OrchestratorAgent")
-            getattr(agents_module, "SummarizerAgent")
-            getattr(agents_module, "LinkerAgent")
-            getattr(agents_module, "VisualizerAgent")
-            A2AProtocol = getattr(agents_module, "A2AProtocol")
-
             # Test agent instantiation (doesn't require full initialization)
-            a2a = A2AProtocol()
-            test_agent = OrchestratorAgent(a2a)
+            probe_agents, _ = _get_probe_agents(agents_module)
+            test_agent = probe_agents.get("orchestrator")
 
             if test_agent and hasattr(test_agent, "name"):
                 adk_status = "operational"
@@ -199,19 +359,22 @@ async def healthz_check():
     if adk_status == "unavailable" or adk_status == "error":
         health_status = "unhealthy"
 
-    return HealthResponse(
+    response = HealthResponse(
         status=health_status,
         environment=environment,
         adk_system=adk_status,
         firestore=firestore_status,
         errors=errors if errors else None,
     )
+    if health_status == "healthy":
+        _healthz_cache = (now, response)
+    return response
 
 
 @app.get("/api/docs", tags=["docs"])
 async def api_docs():
     """API documentation endpoint"""
-    return {"docs_url": "/docs"}
+    return Response(content=_API_DOCS_BODY, media_type="application/json")
 
 
 # Text Generation Integration
@@ -295,7 +458,7 @@ async def analyze_content(request: AnalyzeRequest):
     """
     import time
 
-    start_time = time.time()
+    start_time = time.monotonic()
 
     try:
         from backend.agents import (
@@ -311,7 +474,7 @@ async def analyze_content(request: AnalyzeRequest):
 
         # Step 1: Initialize SessionContext with raw_input
         session_context = create_session_context(
-            session_id=f"session_{int(start_time)}",
+            session_id=f"session_{int(time.time())}",
             raw_input=request.document,
             content_type=request.content_type or "document",
             workflow_status="initializing",
@@ -362,7 +525,7 @@ async def analyze_content(request: AnalyzeRequest):
             "from_cache": session_context.workflow_status == "completed_from_cache",
         }
 
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
 
         logger.info(f"🏁 ADK Multi-Agent Analysis completed in {processing_time:.2f}s")
         logger.info(f"   Summary: {len(summary)} chars")
@@ -387,7 +550,7 @@ async def analyze_content(request: AnalyzeRequest):
             detail="ADK multi-agent system not available. Check agent implementations.",
         )
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
         logger.error(f"Multi-agent analysis failed: {e}")
         import traceback
 
@@ -462,19 +625,13 @@ async def get_agent_status():
         diagnostic_info["environment_vars"][var] = "set" if value else "missing"
 
     try:
-        from backend.agents import (
-            A2AProtocol,
-            LinkerAgent,
-            OrchestratorAgent,
-            SummarizerAgent,
-            VisualizerAgent,
-        )
+        from backend import agents as agents_module
 
         logger.info("🔍 Checking ADK agent system status...")
 
-        # Create temporary agents to check status
+        # Reuse the shared probe agents (built on first request)
         try:
-            a2a = A2AProtocol()
+            agents, agent_errors = _get_probe_agents(agents_module)
             diagnostic_info["a2a_protocol"] = "initialized"
         except Exception as e:
             diagnostic_info["initialization_errors"].append(
@@ -490,34 +647,17 @@ async def get_agent_status():
                 "error": f"A2A Protocol initialization failed: {str(e)}",
             }
 
-        agents = {}
-        agent_errors = []
-
-        # Test each agent individually to identify specific failures
-        agent_classes = {
-            "orchestrator": OrchestratorAgent,
-            "summarizer": SummarizerAgent,
-            "linker": LinkerAgent,
-            "visualizer": VisualizerAgent,
-        }
-
-        for name, agent_class in agent_classes.items():
-            try:
-                agent = agent_class(a2a)
-                agents[name] = agent
-                logger.debug(f"✅ {name} agent initialized successfully")
-            except Exception as e:
-                error_msg = f"{name} agent initialization failed: {str(e)}"
-                agent_errors.append(error_msg)
-                diagnostic_info["initialization_errors"].append(error_msg)
-                logger.error(f"❌ {error_msg}")
+        # Individual agent failures are reported without failing the request
+        for error_msg in agent_errors:
+            diagnostic_info["initialization_errors"].append(error_msg)
+            logger.error(f"❌ {error_msg}")
 
         if not agents:
             return {
                 "total_agents": 0,
                 "agents": {},
                 "adk_system": "unavailable",
-                "a2a_protocol": "enabled" if a2a else "disabled",
+                "a2a_protocol": "enabled",
                 "diagnostics": diagnostic_info,
                 "error": "All agent initializations failed. Check diagnostic_info for details.",
                 "agent_errors": agent_errors,
@@ -561,7 +701,7 @@ async def get_agent_status():
             "total_agents": len(agents),
             "agents": agent_status,
             "adk_system": (
-                "operational" if len(agents) == len(agent_classes) else "degraded"
+                "operational" if len(agents) == len(_AGENT_CLASS_NAMES) else "degraded"
             ),
             "a2a_protocol": "enabled",
             "firestore_status": firestore_status,
@@ -573,7 +713,7 @@ async def get_agent_status():
             response["warnings"] = f"{len(agent_errors)} agent(s) failed to initialize"
 
         logger.info(
-            f"✅ ADK status check complete: {response['adk_system']}, {len(agents)}/{len(agent_classes)} agents available"
+            f"✅ ADK status check complete: {response['adk_system']}, {len(agents)}/{len(_AGENT_CLASS_NAMES)} agents available"
         )
         return response
 
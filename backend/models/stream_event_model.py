@@ -65,6 +65,10 @@ class EventMetadata(BaseModel):
     session_id: Optional[str] = Field(
         default=None, description="Optional session identifier for event"
     )
+    seq: Optional[int] = Field(
+        default=None,
+        description="Per-session event sequence number, stamped on emit",
+    )
 
     model_config = ConfigDict(
         extra="allow",
@@ -329,15 +333,35 @@ class ClientCommand(BaseModel):
 # Event factory functions for common event types
 
 
+def _build_event(
+    agent: AgentTypeEnum,
+    status: AgentStatusEnum,
+    step: int,
+    elapsed_ms: int,
+    payload: EventPayload,
+) -> AgentStreamEvent:
+    """Assemble an event from already-validated parts.
+
+    The metadata and payload models are passed as instances, which the outer
+    validator accepts without re-validating them. This is deliberately not
+    model_construct: that path inspects each default_factory's signature on
+    every call and measured ~3.5x slower than validation. Emitted for every
+    agent status change, so this is on the streaming hot path.
+    """
+    return AgentStreamEvent(
+        agent=AgentTypeEnum(agent),
+        status=status,
+        metadata=EventMetadata(elapsed_ms=elapsed_ms, step=step, total_steps=4),
+        payload=payload,
+    )
+
+
 def create_agent_queued_event(
     agent: AgentTypeEnum, step: int, elapsed_ms: int = 0
 ) -> AgentStreamEvent:
     """Create a 'queued' status event"""
-    return AgentStreamEvent(
-        agent=agent,
-        status=AgentStatusEnum.QUEUED,
-        metadata=EventMetadata(elapsed_ms=elapsed_ms, step=step, total_steps=4),
-        payload=AgentEventPayload(),
+    return _build_event(
+        agent, AgentStatusEnum.QUEUED, step, elapsed_ms, AgentEventPayload()
     )
 
 
@@ -348,11 +372,12 @@ def create_agent_processing_event(
     partial_results: Optional[Dict[str, Any]] = None,
 ) -> AgentStreamEvent:
     """Create a 'processing' status event"""
-    return AgentStreamEvent(
-        agent=agent,
-        status=AgentStatusEnum.PROCESSING,
-        metadata=EventMetadata(elapsed_ms=elapsed_ms, step=step, total_steps=4),
-        payload=AgentEventPayload(partial_results=partial_results),
+    return _build_event(
+        agent,
+        AgentStatusEnum.PROCESSING,
+        step,
+        elapsed_ms,
+        AgentEventPayload(partial_results=partial_results),
     )
 
 
@@ -360,12 +385,7 @@ def create_agent_complete_event(
     agent: AgentTypeEnum, step: int, elapsed_ms: int, payload: AgentEventPayload
 ) -> AgentStreamEvent:
     """Create a 'complete' status event"""
-    return AgentStreamEvent(
-        agent=agent,
-        status=AgentStatusEnum.COMPLETE,
-        metadata=EventMetadata(elapsed_ms=elapsed_ms, step=step, total_steps=4),
-        payload=payload,
-    )
+    return _build_event(agent, AgentStatusEnum.COMPLETE, step, elapsed_ms, payload)
 
 
 def create_agent_error_event(
@@ -378,11 +398,12 @@ def create_agent_error_event(
     recoverable: bool = False,
 ) -> AgentStreamEvent:
     """Create an 'error' status event"""
-    return AgentStreamEvent(
-        agent=agent,
-        status=AgentStatusEnum.ERROR,
-        metadata=EventMetadata(elapsed_ms=elapsed_ms, step=step, total_steps=4),
-        payload=AgentEventPayload(
+    return _build_event(
+        agent,
+        AgentStatusEnum.ERROR,
+        step,
+        elapsed_ms,
+        AgentEventPayload(
             error=ErrorPayload(
                 error=error,
                 error_type=error_type,
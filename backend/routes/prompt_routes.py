@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import re
+from typing import Awaitable, Callable, Dict, List, Optional
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
@@ -14,6 +18,52 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/prompt-assistant", tags=["prompt-vault"])
 
+# One line per match: optional bullet marker, then the item text without
+# surrounding whitespace. Blank lines never match because the item must start
+# with a non-space character.
+_BULLET_RE = re.compile(r"(?m)^[ \t]*(?:[-*•][ \t]*)?(\S.*?)[ \t\r]*$")
+
+# In-flight Gemini calls keyed by the full LLM prompt. Concurrent identical
+# requests (e.g. several Prompt Vault users hitting a template) share one call.
+_inflight_suggestions: Dict[str, "asyncio.Future[str]"] = {}
+
+# Completed suggestions keyed by a digest of the LLM prompt. Repeat requests for
+# the same prompt/goal/count are served without another Gemini round trip.
+SUGGESTION_CACHE_MAXSIZE = 10_000
+SUGGESTION_CACHE_TTL_SECONDS = 600
+_suggestion_cache: "TTLCache[bytes, List[str]]" = TTLCache(
+    maxsize=SUGGESTION_CACHE_MAXSIZE, ttl=SUGGESTION_CACHE_TTL_SECONDS
+)
+
+
+def _suggestion_cache_key(llm_prompt: str) -> bytes:
+    return hashlib.blake2b(llm_prompt.encode("utf-8"), digest_size=16).digest()
+
+
+async def _coalesced_generate(
+    llm_prompt: str, generate: Callable[..., Awaitable[str]]
+) -> str:
+    """Run `generate` once per distinct prompt among concurrent callers."""
+
+    future = _inflight_suggestions.get(llm_prompt)
+    if future is None:
+        future = asyncio.ensure_future(
+            generate(prompt=llm_prompt, max_tokens=512, temperature=0.2)
+        )
+        _inflight_suggestions[llm_prompt] = future
+
+        def _release(done: "asyncio.Future[str]") -> None:
+            _inflight_suggestions.pop(llm_prompt, None)
+            # Retrieve the error so it is logged here rather than reported as
+            # never retrieved when every waiter has already been cancelled
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning("Prompt suggestion failed: %s", done.exception())
+
+        future.add_done_callback(_release)
+
+    # Shield so one caller disconnecting does not cancel the shared call
+    return await asyncio.shield(future)
+
 
 class SuggestionRequest(BaseModel):
     prompt: str
@@ -63,15 +113,14 @@ async def suggest_prompt(
     llm_prompt = base_prompt.format(count=payload.max_suggestions)
     llm_prompt += f"\n\nOriginal prompt:\n{payload.prompt.strip()}\n"
 
-    suggestions_text = await reason_with_gemini(
-        prompt=llm_prompt,
-        max_tokens=512,
-        temperature=0.2,
-    )
+    cache_key = _suggestion_cache_key(llm_prompt)
+    suggestions = _suggestion_cache.get(cache_key)
 
-    suggestions = [
-        item.strip(" -") for item in suggestions_text.splitlines() if item.strip()
-    ]
+    if suggestions is None:
+        suggestions_text = await _coalesced_generate(llm_prompt, reason_with_gemini)
+        suggestions = [m.group(1) for m in _BULLET_RE.finditer(suggestions_text)]
+        if suggestions:
+            _suggestion_cache[cache_key] = suggestions
 
     if not suggestions:
         suggestions = [payload.prompt.strip()]
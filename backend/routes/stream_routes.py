@@ -6,11 +6,13 @@ Provides real-time streaming of agent workflow events via WebSocket.
 
 import asyncio
 import logging
+import secrets
 import time
-import uuid
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import APIRouter, HTTPException, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 
 from backend.agents import AgentWorkflow, LinkerAgent, SummarizerAgent, VisualizerAgent
 from backend.agents.orchestrator_agent import OrchestratorAgent
@@ -20,11 +22,18 @@ from backend.models.stream_event_model import (
     ErrorType,
     WorkflowStreamRequest,
 )
-from backend.services.event_emitter import EventEmitter, get_event_emitter_manager
+from backend.services.event_emitter import (
+    CLIENT_QUEUE_MAXSIZE,
+    EventEmitter,
+    get_event_emitter_manager,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["streaming"])
 
+# Serialized /stream/stats body for the manager's current stats snapshot
+_stats_body_cache: Optional[Tuple[Dict[str, Any], bytes]] = None
+
 
 @router.websocket("/navigate/stream")
 async def stream_workflow(websocket: WebSocket):
@@ -47,7 +56,7 @@ async def stream_workflow(websocket: WebSocket):
     }
     """
 
-    session_id = f"session_{uuid.uuid4().hex[:12]}"
+    session_id = f"session_{secrets.token_hex(6)}"
     emitter_manager = get_event_emitter_manager()
     emitter = emitter_manager.create_emitter(session_id)
 
@@ -59,7 +68,7 @@ async def stream_workflow(websocket: WebSocket):
         logger.info(f"✅ WebSocket accepted: {session_id}")
 
         # Register client for event streaming
-        client_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        client_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=CLIENT_QUEUE_MAXSIZE)
         emitter.register_client(client_queue)
 
         # Start background task to send events to client
@@ -177,9 +186,85 @@ async def stream_workflow(websocket: WebSocket):
         logger.info(f"🧹 Cleaned up session: {session_id}")
 
 
+@router.post("/navigate/sse")
+async def stream_workflow_sse(request: WorkflowStreamRequest) -> StreamingResponse:
+    """
+    Server-Sent Events variant of the workflow stream.
+
+    Runs the same multi-agent workflow as the WebSocket endpoint and writes
+    each agent event as an SSE `data:` frame as soon as it is emitted, so
+    clients see partial results (summary, entities, graph) before the whole
+    analysis finishes. Useful where WebSockets are unavailable.
+    """
+    session_id = f"session_{secrets.token_hex(6)}"
+    logger.info(f"📡 SSE stream initiated: {session_id}")
+
+    return StreamingResponse(
+        _stream_workflow_events(session_id, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_workflow_events(
+    session_id: str, request: WorkflowStreamRequest
+) -> AsyncIterator[bytes]:
+    """
+    Run the workflow and yield its events as SSE frames.
+
+    Args:
+        session_id: Session identifier
+        request: Validated workflow request
+
+    Yields:
+        Encoded `data: <json array>` frames, one per batch of events (the
+        same pre-serialised payload the WebSocket sends)
+    """
+    emitter_manager = get_event_emitter_manager()
+    emitter = emitter_manager.create_emitter(session_id)
+    client_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=CLIENT_QUEUE_MAXSIZE)
+    emitter.register_client(client_queue)
+
+    workflow_task = asyncio.create_task(
+        _execute_stream_workflow(
+            session_id, request.document, request.content_type, emitter
+        )
+    )
+
+    next_event: Optional["asyncio.Future[bytes]"] = None
+    try:
+        while True:
+            next_event = asyncio.ensure_future(client_queue.get())
+            done, _ = await asyncio.wait(
+                {next_event, workflow_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if next_event in done:
+                yield b"data: " + next_event.result() + b"\n\n"
+                continue
+
+            # Workflow finished: flush anything it queued, then end the stream
+            next_event.cancel()
+            emitter.flush()
+            while not client_queue.empty():
+                yield b"data: " + client_queue.get_nowait() + b"\n\n"
+            break
+
+    finally:
+        # Client went away mid-stream: stop the workflow rather than orphan it,
+        # and drop the pending queue read
+        if next_event is not None and not next_event.done():
+            next_event.cancel()
+        if not workflow_task.done():
+            workflow_task.cancel()
+        emitter.unregister_client(client_queue)
+        emitter_manager.remove_emitter(session_id)
+        logger.info(f"🧹 Cleaned up SSE session: {session_id}")
+
+
 async def _send_events_to_client(
     websocket: WebSocket,
-    client_queue: asyncio.Queue[Dict[str, Any]],
+    client_queue: asyncio.Queue[bytes],
     session_id: str,
 ) -> None:
     """
@@ -187,20 +272,20 @@ async def _send_events_to_client(
 
     Args:
         websocket: WebSocket connection to client
-        client_queue: Queue containing events from emitter
+        client_queue: Queue of pre-serialised event batches (JSON arrays)
         session_id: Session identifier for logging
     """
     try:
         while True:
             try:
-                # Wait for event with timeout
-                event = await asyncio.wait_for(
+                # Wait for the next batch of events with timeout
+                batch = await asyncio.wait_for(
                     client_queue.get(), timeout=300.0  # 5 minute timeout
                 )
 
-                # Send event to client
-                await websocket.send_json(event)
-                logger.debug(f"📤 Event sent to client: {session_id}")
+                # Send the batch as one JSON array text frame, as serialised
+                await websocket.send_text(batch.decode("utf-8"))
+                logger.debug(f"📤 Event batch sent to client: {session_id}")
 
             except asyncio.TimeoutError:
                 logger.warning(f"⏱️  Event queue timeout: {session_id}")
@@ -232,7 +317,7 @@ async def _execute_stream_workflow(
     """
     try:
         logger.info(f"🚀 Starting workflow: {session_id}")
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Create orchestrator with event emitter
         orchestrator = OrchestratorAgent(event_emitter=emitter)
@@ -268,7 +353,7 @@ async def _execute_stream_workflow(
         result_context = await workflow.execute_sequential_workflow(context)
 
         # Emit final complete event
-        elapsed_seconds = time.time() - start_time
+        elapsed_seconds = time.monotonic() - start_time
         await emitter.emit_agent_complete(
             agent=AgentTypeEnum.VISUALIZER,
             step=4,
@@ -346,13 +431,25 @@ async def get_stream_stats():
     """
     Get statistics about all active streaming sessions.
 
+    The manager refreshes its snapshot at most once per second; the JSON body
+    is serialized once per snapshot and reused for every poll in between.
+
     Returns:
         Dictionary with stats for each session
     """
+    global _stats_body_cache
+
     emitter_manager = get_event_emitter_manager()
     stats = emitter_manager.get_all_stats()
 
-    return {"active_sessions": len(stats), "sessions": stats, "timestamp": time.time()}
+    cached = _stats_body_cache
+    if cached is None or cached[0] is not stats:
+        body = orjson.dumps(
+            {"active_sessions": len(stats), "sessions": stats, "timestamp": time.time()}
+        )
+        cached = _stats_body_cache = (stats, body)
+
+    return Response(content=cached[1], media_type="application/json")
 
 
 @router.get("/stream/stats/{session_id}")
@@ -364,7 +461,8 @@ async def get_session_stats(session_id: str):
         session_id: Session identifier
 
     Returns:
-        Statistics for the session
+        Statistics and recent event history for the session. The events are
+        spliced in as the bytes already serialized for streaming.
 
     Raises:
         HTTPException: If session not found
@@ -375,11 +473,14 @@ async def get_session_stats(session_id: str):
     if not emitter:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return {
-        "session_id": session_id,
-        "stats": emitter.get_stats(),
-        "events": emitter.get_event_history(),
-    }
+    body = orjson.dumps(
+        {
+            "session_id": session_id,
+            "stats": emitter.get_stats(),
+            "events": orjson.Fragment(emitter.get_event_history_json()),
+        }
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/stream/cleanup")
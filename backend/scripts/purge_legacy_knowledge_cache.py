@@ -0,0 +1,37 @@
+"""
+Purge Legacy Knowledge Cache Script
+Deletes knowledge_cache entries keyed by an older content hash version
+(including the original SHA-256 keys). No lookup can reach them any more, and
+entries with an epoch-second expires_at are ignored by the Firestore TTL
+policy, so without this they would only go once cleanup_expired_entries runs
+after they expire.
+
+Usage:
+    python backend/scripts/purge_legacy_knowledge_cache.py
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.services.knowledge_cache_service import get_knowledge_cache_service
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    logger.info("🧹 Purging legacy knowledge cache entries...")
+    deleted_count = asyncio.run(get_knowledge_cache_service().purge_legacy_entries())
+    logger.info(f"✅ Purged {deleted_count} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -74,50 +74,60 @@ def seed_prompts():
     logger.info("🌱 Starting prompt seeding...")
 
     try:
-        collection = get_firestore_client().get_collection("agent_prompts")
+        firestore_client = get_firestore_client()
+        collection = firestore_client.get_collection("agent_prompts")
 
         seeded_count = 0
         updated_count = 0
 
+        # Read every prompt document in one round trip and write them back in
+        # a single batch instead of a get + set/update per prompt
+        doc_refs = {prompt_id: collection.document(prompt_id) for prompt_id in PROMPTS}
+        existing = {
+            doc.id: doc
+            for doc in firestore_client.client.get_all(list(doc_refs.values()))
+            if doc.exists
+        }
+
+        batch = firestore_client.client.batch()
+        now = datetime.now(timezone.utc)
+
         for prompt_id, prompt_text in PROMPTS.items():
-            try:
-                # Check if document exists
-                doc_ref = collection.document(prompt_id)
-                doc = doc_ref.get()
-
-                if doc.exists:
-                    # Update existing document
-                    logger.info(f"  ↻ Updating existing prompt: {prompt_id}")
-                    current_version = doc.to_dict().get("version", 1)
-                    doc_ref.update(
-                        {
-                            "prompt_text": prompt_text,
-                            "updated_at": datetime.now(timezone.utc),
-                            "version": current_version + 1,
-                        }
-                    )
-                    updated_count += 1
-                else:
-                    # Create new document
-                    logger.info(f"  ➕ Creating new prompt: {prompt_id}")
-                    now = datetime.now(timezone.utc)
-                    doc_ref.set(
-                        {
-                            "prompt_text": prompt_text,
-                            "created_at": now,
-                            "updated_at": now,
-                            "version": 1,
-                            "metadata": {
-                                "agent_name": prompt_id.split("_")[0],
-                                "prompt_type": "_".join(prompt_id.split("_")[1:]),
-                            },
-                        }
-                    )
-                    seeded_count += 1
-
-            except Exception as e:
-                logger.error(f"  ❌ Error processing {prompt_id}: {e}")
-                continue
+            doc_ref = doc_refs[prompt_id]
+            doc = existing.get(prompt_id)
+
+            if doc is not None:
+                # Update existing document
+                logger.info(f"  ↻ Updating existing prompt: {prompt_id}")
+                current_version = doc.to_dict().get("version", 1)
+                batch.update(
+                    doc_ref,
+                    {
+                        "prompt_text": prompt_text,
+                        "updated_at": now,
+                        "version": current_version + 1,
+                    },
+                )
+                updated_count += 1
+            else:
+                # Create new document
+                logger.info(f"  ➕ Creating new prompt: {prompt_id}")
+                batch.set(
+                    doc_ref,
+                    {
+                        "prompt_text": prompt_text,
+                        "created_at": now,
+                        "updated_at": now,
+                        "version": 1,
+                        "metadata": {
+                            "agent_name": prompt_id.split("_")[0],
+                            "prompt_type": "_".join(prompt_id.split("_")[1:]),
+                        },
+                    },
+                )
+                seeded_count += 1
+
+        batch.commit()
 
         logger.info("✅ Seeding complete!")
         logger.info(f"   Created: {seeded_count}")
@@ -138,12 +148,14 @@ def verify_seed():
     logger.info("🔍 Verifying seed...")
 
     try:
-        for prompt_id in PROMPTS.keys():
-            try:
-                get_prompt_loader().get_prompt(prompt_id)
+        # One batched Firestore read for every seeded prompt
+        loaded = get_prompt_loader().get_prompts(PROMPTS.keys())
+
+        for prompt_id in PROMPTS:
+            if prompt_id in loaded:
                 logger.info(f"  ✓ {prompt_id}: Loaded successfully")
-            except Exception as e:
-                logger.error(f"  ✗ {prompt_id}: Failed to load - {e}")
+            else:
+                logger.error(f"  ✗ {prompt_id}: Failed to load - missing or empty")
 
     except Exception as e:
         logger.error(f"Verification failed: {e}")
@@ -11,16 +11,32 @@ This replaces the basic A2AProtocol class in base_agent.py with
 a production-ready implementation.
 """
 
+import heapq
+import itertools
 import json
 import logging
 import time
-from collections import defaultdict
-from typing import Any, Dict, List, Literal, Optional
+from collections import Counter, defaultdict, deque
+from types import MappingProxyType
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from backend.models.a2a_messages import (
     A2AMessageBase,
     A2AMessagePriority,
     A2AMessageStatus,
+    A2ASecurityContext,
+    A2ATraceContext,
     AgentStatusMessage,
     KnowledgeTransferMessage,
     TaskDelegationMessage,
@@ -31,6 +47,25 @@ from backend.services.a2a_security import get_security_service
 
 logger = logging.getLogger(__name__)
 
+# Most recent messages kept per session for traceability
+MESSAGE_HISTORY_MAXLEN = 10_000
+
+# Heap ordering for pending messages: higher priority first
+_PRIORITY_RANK = {
+    A2AMessagePriority.CRITICAL: 4,
+    A2AMessagePriority.HIGH: 3,
+    A2AMessagePriority.MEDIUM: 2,
+    A2AMessagePriority.LOW: 1,
+}
+
+# Plain string values for log entries, looked up instead of isinstance checks
+_PRIORITY_VALUES = {member: member.value for member in A2AMessagePriority}
+_STATUS_VALUES = {member: member.value for member in A2AMessageStatus}
+
+# (-priority rank, timestamp, send sequence, message); the sequence number
+# breaks ties so messages themselves are never compared
+_QueueEntry = Tuple[int, float, int, A2AMessageBase]
+
 
 class A2AProtocolService:
     """
@@ -50,17 +85,26 @@ class A2AProtocolService:
         self.session_id = session_id or f"session_{int(time.time())}"
         self.correlation_id = create_correlation_id(self.session_id)
 
-        # Message queue (priority-sorted)
-        self._message_queue: List[A2AMessageBase] = []
+        # Pending message heaps per recipient; broadcasts ("*") go to the
+        # first reader
+        self._queues: "defaultdict[str, List[_QueueEntry]]" = defaultdict(list)
+        self._broadcast: List[_QueueEntry] = []
+        self._send_seq = itertools.count()
 
         # Message history for traceability
-        self._message_history: List[A2AMessageBase] = []
+        self._message_history: Deque[A2AMessageBase] = deque(
+            maxlen=MESSAGE_HISTORY_MAXLEN
+        )
+
+        # Running totals for get_protocol_stats (cover messages evicted above)
+        self._message_type_counts: "Counter[str]" = Counter()
+        self._agent_activity: "Counter[str]" = Counter()
 
         # Shared context store (for backward compatibility)
         self._context_store: Dict[str, Any] = {}
 
-        # Message subscriptions (agent -> message_types)
-        self._subscriptions: Dict[str, List[str]] = defaultdict(list)
+        # Message subscriptions, indexed by type (message_type -> agents)
+        self._subscribers_by_type: "defaultdict[str, Set[str]]" = defaultdict(set)
 
         # Security service
         self._security_service = get_security_service()
@@ -83,26 +127,17 @@ class A2AProtocolService:
         try:
             # Ensure message has trace context
             if not hasattr(message, "trace") or not message.trace:
-                from backend.models.a2a_messages import A2ATraceContext
-
                 message.trace = A2ATraceContext(
                     correlation_id=self.correlation_id,
                     parent_message_id=None,
                     span_id=None,
                 )
 
-            # Convert to dict for security processing
-            message_dict = message.model_dump()
-
             # Add security context
-            message_dict = self._security_service.enhance_message_with_security(
-                message_dict
-            )
+            self._security_service.enhance_message_security(message)
 
             # Validate security
-            validation_result = self._security_service.validate_message_security(
-                message_dict
-            )
+            validation_result = self._security_service.validate_typed_message(message)
 
             if not validation_result["is_valid"]:
                 logger.error(
@@ -112,22 +147,31 @@ class A2AProtocolService:
                     f"Security validation failed: {validation_result['issues']}"
                 )
 
-            # Update message with security context
-            message.security.signature = message_dict["security"]["signature"]
-            message.security.service_account_id = message_dict["security"][
-                "service_account_id"
-            ]
             message.security.verified = True
 
             # Log message with structured metadata
             self._log_message_event("message_sent", message)
 
-            # Add to queue (sorted by priority)
-            self._message_queue.append(message)
-            self._sort_message_queue()
+            # Add to the recipient's queue (highest priority, then oldest, first)
+            queue = (
+                self._broadcast
+                if message.to_agent == "*"
+                else self._queues[message.to_agent]
+            )
+            heapq.heappush(
+                queue,
+                (
+                    -_PRIORITY_RANK.get(message.priority, 0),
+                    message.timestamp,
+                    next(self._send_seq),
+                    message,
+                ),
+            )
 
             # Add to history for traceability
             self._message_history.append(message)
+            self._message_type_counts[message.message_type] += 1
+            self._agent_activity[message.from_agent] += 1
 
             # Update shared context if it's a knowledge transfer
             if isinstance(message, KnowledgeTransferMessage):
@@ -153,21 +197,33 @@ class A2AProtocolService:
             message_types: Optional filter for specific message types
 
         Returns:
-            List of messages for the agent
+            List of messages for the agent, highest priority first
         """
-        # Filter messages for this agent
-        agent_messages = [
-            msg
-            for msg in self._message_queue
-            if (msg.to_agent == agent_name or msg.to_agent == "*")
-            and (not message_types or msg.message_type in message_types)
-            and not msg.is_expired()
-        ]
-
-        # Remove retrieved messages from queue
-        self._message_queue = [
-            msg for msg in self._message_queue if msg not in agent_messages
-        ]
+        drained: List[List[_QueueEntry]] = []
+
+        # Drain the agent's own queue and the broadcast queue. Expired messages
+        # are dropped; messages filtered out by type stay queued.
+        for queue in (self._queues.get(agent_name), self._broadcast):
+            if not queue:
+                continue
+
+            taken: List[_QueueEntry] = []
+            held: List[_QueueEntry] = []
+            while queue:
+                entry = heapq.heappop(queue)
+                msg = entry[-1]
+                if msg.is_expired():
+                    continue
+                if message_types and msg.message_type not in message_types:
+                    held.append(entry)
+                else:
+                    taken.append(entry)
+
+            # Entries were popped in heap order, so the held list is a valid heap
+            queue.extend(held)
+            drained.append(taken)
+
+        agent_messages = [entry[-1] for entry in heapq.merge(*drained)]
 
         # Mark messages as processing
         for msg in agent_messages:
@@ -180,28 +236,15 @@ class A2AProtocolService:
 
         return agent_messages
 
-    def _sort_message_queue(self):
-        """Sort message queue by priority"""
-        priority_order = {
-            A2AMessagePriority.CRITICAL: 4,
-            A2AMessagePriority.HIGH: 3,
-            A2AMessagePriority.MEDIUM: 2,
-            A2AMessagePriority.LOW: 1,
-        }
-
-        self._message_queue.sort(
-            key=lambda m: (priority_order.get(m.priority, 0), -m.timestamp),
-            reverse=True,
-        )
-
-    def get_shared_context(self) -> Dict[str, Any]:
+    def get_shared_context(self) -> Mapping[str, Any]:
         """
         Get shared context (for backward compatibility)
 
         Returns:
-            Dictionary of shared context data
+            Read-only live view of the shared context data; copy it with
+            dict() if a mutable snapshot is needed
         """
-        return self._context_store.copy()
+        return MappingProxyType(self._context_store)
 
     def update_shared_context(self, key: str, value: Any):
         """
@@ -231,7 +274,7 @@ class A2AProtocolService:
         Returns:
             List of historical messages
         """
-        history = self._message_history
+        history: Iterable[A2AMessageBase] = self._message_history
 
         # Apply filters
         if agent_name:
@@ -245,7 +288,7 @@ class A2AProtocolService:
             history = [msg for msg in history if msg.message_type == message_type]
 
         # Apply limit
-        return history[-limit:]
+        return list(history)[-limit:]
 
     def get_protocol_stats(self) -> Dict[str, Any]:
         """
@@ -254,20 +297,14 @@ class A2AProtocolService:
         Returns:
             Dictionary of protocol statistics
         """
-        message_types: "defaultdict[str, int]" = defaultdict(int)
-        agent_activity: "defaultdict[str, int]" = defaultdict(int)
-
-        for msg in self._message_history:
-            message_types[msg.message_type] += 1
-            agent_activity[msg.from_agent] += 1
-
         return {
             "session_id": self.session_id,
             "correlation_id": self.correlation_id,
-            "total_messages": len(self._message_history),
-            "pending_messages": len(self._message_queue),
-            "message_types": dict(message_types),
-            "agent_activity": dict(agent_activity),
+            "total_messages": sum(self._message_type_counts.values()),
+            "pending_messages": len(self._broadcast)
+            + sum(len(queue) for queue in self._queues.values()),
+            "message_types": dict(self._message_type_counts),
+            "agent_activity": dict(self._agent_activity),
             "shared_context_keys": list(self._context_store.keys()),
         }
 
@@ -285,11 +322,13 @@ class A2AProtocolService:
             message: The A2A message
             additional_data: Additional event data
         """
+        # Sent and received events fire for every message; skip building and
+        # serialising the entry when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
-        # Helper to safely extract enum values
-        def get_enum_value(field, enum_type):
-            """Extract enum value safely"""
-            return field.value if isinstance(field, enum_type) else field
+        trace = getattr(message, "trace", None)
+        security = getattr(message, "security", None)
 
         # Build structured log entry
         log_entry = {
@@ -302,36 +341,29 @@ class A2AProtocolService:
                 "message_type": message.message_type,
                 "from_agent": message.from_agent,
                 "to_agent": message.to_agent,
-                "priority": get_enum_value(message.priority, A2AMessagePriority),
-                "status": get_enum_value(message.status, A2AMessageStatus),
+                "priority": _PRIORITY_VALUES.get(message.priority, message.priority),
+                "status": _STATUS_VALUES.get(message.status, message.status),
             },
             "trace_context": {
-                "correlation_id": (
-                    message.trace.correlation_id if hasattr(message, "trace") else None
-                ),
-                "parent_message_id": (
-                    message.trace.parent_message_id
-                    if hasattr(message, "trace")
-                    else None
-                ),
+                "correlation_id": trace.correlation_id if trace else None,
+                "parent_message_id": trace.parent_message_id if trace else None,
             },
             "security_context": {
-                "service_account_id": (
-                    message.security.service_account_id
-                    if hasattr(message, "security")
-                    else None
-                ),
-                "verified": (
-                    message.security.verified if hasattr(message, "security") else False
-                ),
+                "service_account_id": security.service_account_id if security else None,
+                "verified": security.verified if security else False,
             },
         }
 
         if additional_data:
             log_entry.update(additional_data)
 
-        # In production, this would send to Cloud Logging with proper severity
-        logger.info(f"A2A_EVENT: {json.dumps(log_entry, default=str)}")
+        # Structured handlers (e.g. google-cloud-logging's StructuredLogHandler)
+        # pick up `json_fields` directly; plain handlers get the JSON text
+        logger.info(
+            "A2A_EVENT: %s",
+            json.dumps(log_entry, default=str),
+            extra={"json_fields": log_entry},
+        )
 
     def subscribe_agent(self, agent_name: str, message_types: List[str]):
         """
@@ -341,18 +373,33 @@ class A2AProtocolService:
             agent_name: Name of the agent
             message_types: List of message types to subscribe to
         """
-        self._subscriptions[agent_name].extend(message_types)
+        for message_type in message_types:
+            self._subscribers_by_type[message_type].add(agent_name)
         logger.info(f"📢 Agent '{agent_name}' subscribed to: {message_types}")
 
     async def broadcast_message(self, message: A2AMessageBase):
         """
         Broadcast message to all subscribed agents
 
+        Each subscriber of the message type gets its own signed copy. With no
+        subscribers the message goes to "*" and is claimed by the first reader.
+
         Args:
             message: Message to broadcast
         """
-        message.to_agent = "*"
-        await self.send_message(message)
+        subscribers = self._subscribers_by_type.get(message.message_type)
+        if not subscribers:
+            message.to_agent = "*"
+            await self.send_message(message)
+            return
+
+        for agent_name in sorted(subscribers):
+            # Fresh security context: each copy is signed for its recipient
+            await self.send_message(
+                message.model_copy(
+                    update={"to_agent": agent_name, "security": A2ASecurityContext()}
+                )
+            )
 
 
 # ============================================================================
@@ -386,8 +433,6 @@ def create_task_delegation_message(
     Returns:
         TaskDelegationMessage instance
     """
-    from backend.models.a2a_messages import A2ATraceContext
-
     return TaskDelegationMessage(
         message_id=create_message_id(from_agent, "task_delegation"),
         from_agent=from_agent,
@@ -429,8 +474,6 @@ def create_knowledge_transfer_message(
     Returns:
         KnowledgeTransferMessage instance
     """
-    from backend.models.a2a_messages import A2ATraceContext
-
     return KnowledgeTransferMessage(
         message_id=create_message_id(from_agent, "knowledge_transfer"),
         from_agent=from_agent,
@@ -470,8 +513,6 @@ def create_status_message(
     Returns:
         AgentStatusMessage instance
     """
-    from backend.models.a2a_messages import A2ATraceContext
-
     return AgentStatusMessage(
         message_id=create_message_id(from_agent, "status"),
         from_agent=from_agent,
@@ -11,16 +11,107 @@ Key Features:
 - Security audit logging for all message operations
 """
 
+import asyncio
 import hashlib
-import json
+import hmac
 import logging
 import os
+import re
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import orjson
+from cachetools import TTLCache
+
+from backend.models.a2a_messages import A2AMessageBase
 
 logger = logging.getLogger(__name__)
 
+# Salt for the optional PBKDF2 stretching of the signing key. It must match
+# across services so they all derive the same key.
+_PBKDF2_SALT = b"agentnav-a2a-signing"
+
+# Accepted message timestamp window (replay protection and clock skew)
+MAX_MESSAGE_AGE_SECONDS = 3600  # 1 hour
+MAX_FUTURE_SKEW_SECONDS = 300  # 5 minutes in future
+
+# Pending security audit events and how many are written per batch
+AUDIT_QUEUE_MAXSIZE = 1024
+AUDIT_BATCH_SIZE = 50
+
+# Field names containing any of these terms are redacted from security logs
+_SENSITIVE_KEY_RE = re.compile(
+    "secret|password|token|key|signature|credential|auth", re.IGNORECASE
+)
+
+# Signature verification results are reused for redelivered messages
+VERIFICATION_CACHE_MAXSIZE = 4096
+VERIFICATION_CACHE_TTL_SECONDS = 60
+
+# Message fields covered by the signature (alongside "data")
+_CANONICAL_KEYS = ("message_id", "from_agent", "to_agent", "message_type", "timestamp")
+
+# Identity fetched from the metadata server (cached once retrieved)
+_cached_identity: Optional["ServiceAccountIdentity"] = None
+_identity_lock = threading.Lock()
+
+# Pooled HTTP session for metadata server requests
+_metadata_session = None
+
+
+def _get_metadata_session():
+    """
+    Get or create the HTTP session used for metadata server requests
+
+    Returns:
+        requests.Session reusing its connection to the metadata server and
+        retrying transient failures
+    """
+    global _metadata_session
+
+    if _metadata_session is None:
+        import requests  # type: ignore[import-untyped]
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _metadata_session = requests.Session()
+        # The metadata server can briefly refuse connections while a new
+        # instance starts; retry with a short exponential backoff
+        _metadata_session.mount(
+            "http://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=3, backoff_factor=0.2, status_forcelist=(500, 503)
+                )
+            ),
+        )
+
+    return _metadata_session
+
+
+class _JsonPayload:
+    """Log argument that is only serialised if the record is formatted"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data
+
+    def __str__(self) -> str:
+        return orjson.dumps(self.data, default=str).decode("utf-8")
+
 
 @dataclass
 class ServiceAccountIdentity:
@@ -57,47 +148,64 @@ class ServiceAccountIdentity:
                 unique_id="dev-123",
             )
 
-        try:
-            import requests  # type: ignore[import-untyped]
+        global _cached_identity
 
-            metadata_server = "http://metadata.google.internal/computeMetadata/v1"
-            metadata_flavor = {"Metadata-Flavor": "Google"}
+        # The identity is fixed for the lifetime of the container
+        if _cached_identity is not None:
+            return _cached_identity
 
-            # Get service account email
-            email_url = f"{metadata_server}/instance/service-accounts/default/email"
-            email_response = requests.get(email_url, headers=metadata_flavor, timeout=2)
-            email = email_response.text.strip()
+        # Concurrent first callers wait for a single metadata server fetch
+        with _identity_lock:
+            if _cached_identity is not None:
+                return _cached_identity
 
-            # Get project ID
-            project_url = f"{metadata_server}/project/project-id"
-            project_response = requests.get(
-                project_url, headers=metadata_flavor, timeout=2
-            )
-            project_id = project_response.text.strip()
+            try:
+                session = _get_metadata_session()
 
-            # Get unique ID
-            unique_id_url = (
-                f"{metadata_server}/instance/service-accounts/default/unique-id"
-            )
-            unique_id_response = requests.get(
-                unique_id_url, headers=metadata_flavor, timeout=2
-            )
-            unique_id = unique_id_response.text.strip()
+                metadata_server = "http://metadata.google.internal/computeMetadata/v1"
+                metadata_flavor = {"Metadata-Flavor": "Google"}
 
-            logger.info(f"✅ Retrieved Cloud Run Service Account: {email}")
+                # Get service account email
+                email_url = f"{metadata_server}/instance/service-accounts/default/email"
+                email_response = session.get(
+                    email_url, headers=metadata_flavor, timeout=2
+                )
+                email = email_response.text.strip()
 
-            return cls(email=email, project_id=project_id, unique_id=unique_id)
+                # Get project ID
+                project_url = f"{metadata_server}/project/project-id"
+                project_response = session.get(
+                    project_url, headers=metadata_flavor, timeout=2
+                )
+                project_id = project_response.text.strip()
 
-        except Exception as e:
-            logger.error(f"❌ Failed to retrieve Cloud Run identity: {e}")
-            # Fallback to environment variables
-            email = os.getenv(
-                "GCP_SERVICE_ACCOUNT_EMAIL", "unknown@unknown.iam.gserviceaccount.com"
-            )
-            project_id = os.getenv("GCP_PROJECT_ID", "unknown")
+                # Get unique ID
+                unique_id_url = (
+                    f"{metadata_server}/instance/service-accounts/default/unique-id"
+                )
+                unique_id_response = session.get(
+                    unique_id_url, headers=metadata_flavor, timeout=2
+                )
+                unique_id = unique_id_response.text.strip()
 
-            logger.warning(f"⚠️  Using fallback identity: {email}")
-            return cls(email=email, project_id=project_id)
+                logger.info(f"✅ Retrieved Cloud Run Service Account: {email}")
+
+                _cached_identity = cls(
+                    email=email, project_id=project_id, unique_id=unique_id
+                )
+                return _cached_identity
+
+            except Exception as e:
+                logger.error(f"❌ Failed to retrieve Cloud Run identity: {e}")
+                # Fallback to environment variables
+                email = os.getenv(
+                    "GCP_SERVICE_ACCOUNT_EMAIL",
+                    "unknown@unknown.iam.gserviceaccount.com",
+                )
+                project_id = os.getenv("GCP_PROJECT_ID", "unknown")
+
+                logger.warning(f"⚠️  Using fallback identity: {email}")
+                return cls(email=email, project_id=project_id)
 
 
 class A2ASecurityService:
@@ -111,11 +219,43 @@ class A2ASecurityService:
     - Security audit logging
     """
 
+    # Authorization rules: targets each agent may send to
+    _AUTHORIZATION_RULES: ClassVar[Mapping[str, FrozenSet[str]]] = MappingProxyType(
+        {
+            "orchestrator": frozenset({"*"}),  # Orchestrator can send to anyone
+            "summarizer": frozenset({"orchestrator", "visualizer", "linker", "*"}),
+            "linker": frozenset({"orchestrator", "visualizer", "*"}),
+            "visualizer": frozenset({"orchestrator", "*"}),
+        }
+    )
+
     def __init__(self):
         self.identity = ServiceAccountIdentity.from_cloud_run_metadata()
         self.trusted_service_accounts: List[str] = self._load_trusted_accounts()
+        # Set view of the trusted accounts for per-message lookups
+        self._trusted_accounts: FrozenSet[str] = frozenset(
+            self.trusted_service_accounts
+        )
         self._secret_key = self._get_signing_key()
 
+        # Signing settings are fixed for the life of the service. The keyed
+        # HMAC state is built once and copied per message.
+        self._use_pbkdf2 = os.getenv("A2A_USE_PBKDF2", "false").lower() == "true"
+        self._pbkdf2_iterations = int(os.getenv("A2A_PBKDF2_ITERATIONS", "100000"))
+        self._hmac_template = hmac.new(
+            self._derive_hmac_key(), digestmod=hashlib.sha256
+        )
+
+        # Security events are written by a background task per event loop
+        self._audit_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_task: Optional[asyncio.Task] = None
+
+        # Recent verification results keyed by (canonical bytes, signature)
+        self._verified_signatures: "TTLCache[Tuple[bytes, str], bool]" = TTLCache(
+            maxsize=VERIFICATION_CACHE_MAXSIZE, ttl=VERIFICATION_CACHE_TTL_SECONDS
+        )
+
         logger.info("🔐 A2A Security Service initialized")
         logger.info(f"   Identity: {self.identity.email}")
         logger.info(f"   Trusted accounts: {len(self.trusted_service_accounts)}")
@@ -183,6 +323,28 @@ class A2ASecurityService:
         # Generate deterministic key from key material
         return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
 
+    def _derive_hmac_key(self) -> bytes:
+        """
+        Derive the HMAC key from the signing secret
+
+        With A2A_USE_PBKDF2 enabled the secret is stretched once with PBKDF2
+        here, rather than running PBKDF2 for every signed message.
+
+        Returns:
+            Key bytes used for HMAC-SHA256 signing
+        """
+        secret = self._secret_key.encode("utf-8")
+        if not self._use_pbkdf2:
+            return secret
+
+        logger.info(
+            "🔐 Deriving A2A signing key with PBKDF2 "
+            f"({self._pbkdf2_iterations} iterations)"
+        )
+        return hashlib.pbkdf2_hmac(
+            "sha256", secret, _PBKDF2_SALT, iterations=self._pbkdf2_iterations
+        )
+
     def sign_message(self, message_dict: Dict[str, Any]) -> str:
         """
         Sign an A2A message using HMAC
@@ -192,48 +354,67 @@ class A2ASecurityService:
 
         Returns:
             Hexadecimal signature string
+        """
+        return self._signature_digest(message_dict).hex()
 
-        Note:
-            Uses HMAC-SHA256 directly for better performance.
-            PBKDF2 is optional and can be enabled via environment variable
-            for enhanced security at the cost of performance.
-        """
-        # Create canonical representation
-        canonical = json.dumps(
-            {
-                "message_id": message_dict.get("message_id"),
-                "from_agent": message_dict.get("from_agent"),
-                "to_agent": message_dict.get("to_agent"),
-                "message_type": message_dict.get("message_type"),
-                "timestamp": message_dict.get("timestamp"),
-                "data": message_dict.get("data", {}),
-            },
-            sort_keys=True,
-        )
+    def sign_messages_batch(self, message_dicts: List[Dict[str, Any]]) -> List[str]:
+        """
+        Sign several A2A messages at once
 
-        # Check if enhanced security mode is enabled
-        use_pbkdf2 = os.getenv("A2A_USE_PBKDF2", "false").lower() == "true"
-
-        if use_pbkdf2:
-            # Enhanced security with PBKDF2 (slower but more secure)
-            iterations = int(os.getenv("A2A_PBKDF2_ITERATIONS", "100000"))
-            signature = hashlib.pbkdf2_hmac(
-                "sha256",
-                canonical.encode("utf-8"),
-                self._secret_key.encode("utf-8"),
-                iterations=iterations,
-            )
-        else:
-            # Standard HMAC-SHA256 (faster, suitable for high throughput)
-            import hmac
+        Every message is signed from a copy of the same keyed HMAC state, so
+        the key is only scheduled once for the whole batch.
 
-            signature = hmac.new(
-                self._secret_key.encode("utf-8"),
-                canonical.encode("utf-8"),
-                hashlib.sha256,
-            ).digest()
+        Args:
+            message_dicts: Messages to sign
 
-        return signature.hex()
+        Returns:
+            Hexadecimal signature strings, in the same order as the messages
+        """
+        return [
+            self._signature_digest(message_dict).hex() for message_dict in message_dicts
+        ]
+
+    def _signature_digest(self, message_dict: Dict[str, Any]) -> bytes:
+        """
+        Compute the raw signature digest for an A2A message
+
+        Args:
+            message_dict: Message data to sign
+
+        Returns:
+            Signature digest bytes
+
+        Note:
+            Always HMAC-SHA256. PBKDF2 (A2A_USE_PBKDF2) only applies to the
+            key derivation in _derive_hmac_key.
+        """
+        # Copying the keyed stdlib HMAC (OpenSSL-backed) measured faster than
+        # both one-shot hmac.digest() and cryptography's HMAC for message-sized
+        # inputs, since it skips re-keying per message
+        return self._canonical_digest(self._canonical_bytes(message_dict))
+
+    def _canonical_digest(self, canonical: bytes) -> bytes:
+        """HMAC-SHA256 digest of a message's canonical bytes"""
+        mac = self._hmac_template.copy()
+        mac.update(canonical)
+        return mac.digest()
+
+    @staticmethod
+    def _canonical_bytes(message_dict: Dict[str, Any]) -> bytes:
+        """
+        Canonical representation of a message: the signed fields with sorted keys
+
+        Args:
+            message_dict: Message data
+
+        Returns:
+            Serialized canonical form
+        """
+        canonical_dict = {key: message_dict.get(key) for key in _CANONICAL_KEYS}
+        canonical_dict["data"] = message_dict.get("data", {})
+        return orjson.dumps(
+            canonical_dict, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
 
     def verify_message_signature(
         self, message_dict: Dict[str, Any], signature: str
@@ -249,8 +430,27 @@ class A2ASecurityService:
             True if signature is valid, False otherwise
         """
         try:
-            expected_signature = self.sign_message(message_dict)
-            is_valid = signature == expected_signature
+            canonical = self._canonical_bytes(message_dict)
+
+            # Redelivered messages (same content, same signature) reuse the
+            # earlier result. The key covers every signed byte, so a changed
+            # message can never hit another message's entry.
+            cache_key = (
+                (canonical, signature) if message_dict.get("message_id") else None
+            )
+            is_valid = self._verified_signatures.get(cache_key) if cache_key else None
+
+            if is_valid is None:
+                try:
+                    signature_bytes = bytes.fromhex(signature)
+                except (TypeError, ValueError):
+                    signature_bytes = b""
+                # Constant-time comparison of the raw digests
+                is_valid = hmac.compare_digest(
+                    signature_bytes, self._canonical_digest(canonical)
+                )
+                if cache_key:
+                    self._verified_signatures[cache_key] = is_valid
 
             if is_valid:
                 logger.debug(
@@ -283,7 +483,7 @@ class A2ASecurityService:
             return True
 
         # Check against trusted accounts list
-        is_trusted = service_account_email in self.trusted_service_accounts
+        is_trusted = service_account_email in self._trusted_accounts
 
         if not is_trusted:
             logger.warning(f"⚠️  Untrusted Service Account: {service_account_email}")
@@ -320,16 +520,24 @@ class A2ASecurityService:
         if not self.authenticate_service_account(service_account_email):
             return False
 
-        # Authorization rules
-        authorization_rules = {
-            "orchestrator": ["*"],  # Orchestrator can send to anyone
-            "summarizer": ["orchestrator", "visualizer", "linker", "*"],
-            "linker": ["orchestrator", "visualizer", "*"],
-            "visualizer": ["orchestrator", "*"],
-        }
+        return self._is_authorized_target(from_agent, to_agent, service_account_email)
 
+    def _is_authorized_target(
+        self, from_agent: str, to_agent: str, service_account_email: str
+    ) -> bool:
+        """
+        Check the authorization rules for an already-authenticated sender
+
+        Args:
+            from_agent: Source agent name
+            to_agent: Target agent name
+            service_account_email: Sending Service Account
+
+        Returns:
+            True if from_agent may send to to_agent, False otherwise
+        """
         # Get allowed targets for this agent
-        allowed_targets = authorization_rules.get(from_agent, [])
+        allowed_targets = self._AUTHORIZATION_RULES.get(from_agent, frozenset())
 
         # Check if target is allowed
         is_authorized = (
@@ -348,7 +556,7 @@ class A2ASecurityService:
                     "from_agent": from_agent,
                     "to_agent": to_agent,
                     "service_account": service_account_email,
-                    "allowed_targets": allowed_targets,
+                    "allowed_targets": sorted(allowed_targets),
                 },
             )
 
@@ -373,17 +581,70 @@ class A2ASecurityService:
             - issues: List[str] of any security issues
             - security_score: int (0-100)
         """
+        service_account = (message_dict.get("security") or {}).get("service_account_id")
+        is_trusted = bool(service_account) and self.authenticate_service_account(
+            service_account
+        )
+        return self._validate_message(message_dict, is_trusted)
+
+    def validate_message_security_batch(
+        self, message_dicts: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Security validation for several A2A messages at once
+
+        Each distinct Service Account in the batch is authenticated once; the
+        per-message checks are the same as validate_message_security().
+
+        Args:
+            message_dicts: Messages to validate
+
+        Returns:
+            Validation result dictionaries, in the same order as the messages
+        """
+        accounts = {
+            (message_dict.get("security") or {}).get("service_account_id")
+            for message_dict in message_dicts
+        }
+        trusted_accounts = {
+            account
+            for account in accounts
+            if account and self.authenticate_service_account(account)
+        }
+
+        return [
+            self._validate_message(
+                message_dict,
+                (message_dict.get("security") or {}).get("service_account_id")
+                in trusted_accounts,
+            )
+            for message_dict in message_dicts
+        ]
+
+    def _validate_message(
+        self, message_dict: Dict[str, Any], is_trusted: bool
+    ) -> Dict[str, Any]:
+        """
+        Run the security checks for one message
+
+        Args:
+            message_dict: Message to validate
+            is_trusted: Whether the message's Service Account authenticated
+
+        Returns:
+            Validation result dictionary (see validate_message_security)
+        """
         issues: List[str] = []
 
         # Extract security context
-        security_ctx = message_dict.get("security", {})
+        security_ctx = message_dict.get("security") or {}
         service_account = security_ctx.get("service_account_id")
         signature = security_ctx.get("signature")
 
         # Check 1: Service Account authentication
         if not service_account:
             issues.append("Missing service_account_id in security context")
-        elif not self.authenticate_service_account(service_account):
+        elif not is_trusted:
             issues.append(f"Untrusted service account: {service_account}")
 
         # Check 2: Message signature
@@ -401,20 +662,22 @@ class A2ASecurityService:
             and isinstance(from_agent, str)
             and isinstance(to_agent, str)
         ):
-            if not self.authorize_agent_communication(
-                from_agent, to_agent, service_account
+            if not (
+                is_trusted
+                and self._is_authorized_target(from_agent, to_agent, service_account)
             ):
                 issues.append(f"Unauthorized communication: {from_agent} → {to_agent}")
         elif service_account:
             issues.append("Missing agent identifiers for authorization check")
 
-        # Check 4: Timestamp freshness (prevent replay attacks)
+        # Check 4: Timestamp freshness (prevent replay attacks). time.time()
+        # is a vDSO read, cheaper than any cached-clock bookkeeping.
         timestamp = message_dict.get("timestamp")
         if timestamp:
             age_seconds = time.time() - timestamp
-            if age_seconds > 3600:  # 1 hour
+            if age_seconds > MAX_MESSAGE_AGE_SECONDS:
                 issues.append(f"Message too old: {age_seconds:.0f} seconds")
-            elif age_seconds < -300:  # 5 minutes in future
+            elif age_seconds < -MAX_FUTURE_SKEW_SECONDS:
                 issues.append("Message timestamp in future")
 
         # Calculate security score
@@ -449,14 +712,30 @@ class A2ASecurityService:
         Returns:
             Enhanced message with security context
         """
+        canonical = self._canonical_bytes(message_dict)
+
+        # Already signed by this service (e.g. a message passed along again).
+        # Signatures this service produced are recorded against the exact
+        # canonical bytes they cover, so a message edited after signing misses
+        # here and is signed again.
+        existing = message_dict.get("security") or {}
+        if (
+            existing.get("signature")
+            and existing.get("service_account_id") == self.identity.email
+            and self._verified_signatures.get((canonical, existing["signature"]))
+        ):
+            return message_dict
+
         # Generate signature
-        signature = self.sign_message(message_dict)
+        signature = self._canonical_digest(canonical).hex()
+        if message_dict.get("message_id"):
+            self._verified_signatures[(canonical, signature)] = True
 
         # Add security context
         message_dict["security"] = {
             "service_account_id": self.identity.email,
             "signature": signature,
-            "signature_algorithm": "PBKDF2-HMAC-SHA256",
+            "signature_algorithm": "HMAC-SHA256",
             "verified": False,  # Will be set to True after verification
         }
 
@@ -466,26 +745,149 @@ class A2ASecurityService:
 
         return message_dict
 
+    def enhance_message_security(self, message: A2AMessageBase) -> None:
+        """
+        Sign a typed A2A message in place
+
+        Equivalent to enhance_message_with_security() but reads the signed
+        fields straight off the model instead of dumping the whole message.
+
+        Args:
+            message: Message to sign
+        """
+        message.security.service_account_id = self.identity.email
+        message.security.signature = self.sign_message(self._security_view(message))
+
+        logger.debug(f"🔐 Enhanced message with security: {message.message_id}")
+
+    def validate_typed_message(self, message: A2AMessageBase) -> Dict[str, Any]:
+        """
+        Security validation for a typed A2A message
+
+        Args:
+            message: Message to validate
+
+        Returns:
+            Validation result dictionary (see validate_message_security)
+        """
+        return self.validate_message_security(self._security_view(message))
+
+    @staticmethod
+    def _security_view(message: A2AMessageBase) -> Dict[str, Any]:
+        """
+        Shallow dict of the fields used for signing and validation
+
+        Args:
+            message: Typed A2A message
+
+        Returns:
+            Dictionary referencing the message's own values (no deep copy)
+        """
+        return {
+            "message_id": message.message_id,
+            "from_agent": message.from_agent,
+            "to_agent": message.to_agent,
+            "message_type": message.message_type,
+            "timestamp": message.timestamp,
+            "data": message.data,
+            "security": {
+                "service_account_id": message.security.service_account_id,
+                "signature": message.security.signature,
+            },
+        }
+
     def _log_security_event(self, event_type: str, event_data: Dict[str, Any]):
         """
         Log security event for audit trail
 
+        Inside an event loop the event is queued and written by a background
+        task, so sanitizing, serialising and (later) audit storage stay off the
+        verification path. When the queue is full the oldest event is dropped.
+        Outside an event loop the event is written immediately.
+
+        Args:
+            event_type: Type of security event
+            event_data: Event details
+        """
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_security_events([(event_type, event_data)])
+            return
+
+        # The singleton outlives event loops (e.g. between test runs), so the
+        # queue and drain task are (re)created for the loop currently running.
+        # Events still queued for a previous loop are written first.
+        if self._audit_loop is not loop or self._audit_task.done():
+            self._write_queued_events()
+            self._audit_loop = loop
+            self._audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+            self._audit_task = loop.create_task(self._drain_security_events())
+
+        if self._audit_queue.full():
+            self._audit_queue.get_nowait()
+            logger.warning("⚠️  Security audit queue full - dropped oldest event")
+        self._audit_queue.put_nowait((event_type, event_data))
+
+    async def _drain_security_events(self):
+        """Write queued security events in batches of up to AUDIT_BATCH_SIZE"""
+        queue = self._audit_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < AUDIT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            self._write_security_events(batch)
+
+    def _write_queued_events(self) -> None:
+        """Write (synchronously) any events left in the audit queue"""
+        queue = self._audit_queue
+        events = []
+        while queue is not None and not queue.empty():
+            events.append(queue.get_nowait())
+        if events:
+            self._write_security_events(events)
+
+    async def aclose(self) -> None:
+        """
+        Stop the audit drain task and write every event still queued
+
+        Called at application shutdown so queued security events are not lost.
+        """
+        task = self._audit_task
+        if task is not None and not task.done():
+            task.cancel()
+            # The drain task only yields while waiting for the next event, so
+            # cancelling never interrupts a batch being written
+            await asyncio.gather(task, return_exceptions=True)
+
+        self._write_queued_events()
+        self._audit_loop = None
+        self._audit_queue = None
+        self._audit_task = None
+
+    def _write_security_events(self, events: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Write security events to the audit log
+
         In production, this should:
         - Send to Cloud Logging with security log severity
         - Trigger alerts for critical events
         - Store in security audit collection in Firestore
 
         Args:
-            event_type: Type of security event
-            event_data: Event details
+            events: (event_type, event_data) pairs
         """
-        # Sanitize event data for logging (remove sensitive fields)
-        sanitized_data = self._sanitize_for_logging(event_data)
+        for event_type, event_data in events:
+            # Sanitize event data for logging (remove sensitive fields)
+            sanitized_data = self._sanitize_for_logging(event_data)
 
-        # In production, send to Cloud Logging
-        logger.warning(
-            f"🔒 SECURITY EVENT: {event_type} - {json.dumps(sanitized_data)}"
-        )
+            # In production, send to Cloud Logging
+            logger.warning(
+                "🔒 SECURITY EVENT: %s - %s", event_type, _JsonPayload(sanitized_data)
+            )
 
         # TODO: Store in Firestore security_audit collection
         # TODO: Trigger alerts for critical events
@@ -500,36 +902,30 @@ class A2ASecurityService:
         Returns:
             Sanitized data safe for logging
         """
-        # List of sensitive field names to redact
-        sensitive_fields = [
-            "secret",
-            "password",
-            "token",
-            "key",
-            "signature",
-            "credential",
-            "auth",
-            "api_key",
-        ]
-
         sanitized: Dict[str, Any] = {}
-        for key, value in data.items():
-            # Check if key contains sensitive terms
-            is_sensitive = any(term in key.lower() for term in sensitive_fields)
-
-            if is_sensitive:
-                sanitized[key] = "[REDACTED]"
-            elif isinstance(value, dict):
-                # Recursively sanitize nested dicts
-                sanitized[key] = self._sanitize_for_logging(value)
-            elif isinstance(value, list):
-                # Sanitize lists of dicts
-                sanitized[key] = [
-                    self._sanitize_for_logging(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                sanitized[key] = value
+
+        # Walk nested dicts (and dicts inside lists) with an explicit stack,
+        # filling each sanitized copy in the source's key order
+        stack = [(data, sanitized)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if _SENSITIVE_KEY_RE.search(key):
+                    target[key] = "[REDACTED]"
+                elif isinstance(value, dict):
+                    target[key] = {}
+                    stack.append((value, target[key]))
+                elif isinstance(value, list):
+                    items: List[Any] = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            items.append({})
+                            stack.append((item, items[-1]))
+                        else:
+                            items.append(item)
+                    target[key] = items
+                else:
+                    target[key] = value
 
         return sanitized
 
@@ -538,6 +934,12 @@ class A2ASecurityService:
 _security_service: Optional[A2ASecurityService] = None
 
 
+async def close_security_service() -> None:
+    """Flush the singleton's queued security events, if it was created"""
+    if _security_service is not None:
+        await _security_service.aclose()
+
+
 def get_security_service() -> A2ASecurityService:
     """
     Get or create singleton A2A Security Service instance
@@ -3,13 +3,26 @@ Context Persistence Service
 Handles storing and retrieving SessionContext from Firestore
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Optional
+
+from cachetools import TTLCache
 
 from backend.models.context_model import SessionContext
 
 logger = logging.getLogger(__name__)
 
+# Saves for the same session within this window are written once
+SAVE_DEBOUNCE_SECONDS = 0.05
+
+# Delay before retrying a batch whose commit failed
+FLUSH_RETRY_SECONDS = 5.0
+
+# Loaded contexts are reused for repeat loads within the TTL
+CONTEXT_CACHE_MAXSIZE = 512
+CONTEXT_CACHE_TTL_SECONDS = 30
+
 
 class ContextPersistenceService:
     """
@@ -29,6 +42,20 @@ class ContextPersistenceService:
         self.firestore_client = firestore_client
         self._collection_name = "agent_context"
 
+        # Latest unsaved context per session, written by the debounced flush
+        self._pending: Dict[str, SessionContext] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Contexts in the batch being committed, and a lock so batches (and
+        # deletes) reach Firestore one at a time, in order
+        self._flushing: Dict[str, SessionContext] = {}
+        self._flush_lock = asyncio.Lock()
+
+        # Recently loaded contexts (invalidated on save and delete)
+        self._ctx_cache: "TTLCache[str, SessionContext]" = TTLCache(
+            maxsize=CONTEXT_CACHE_MAXSIZE, ttl=CONTEXT_CACHE_TTL_SECONDS
+        )
+
     def _get_client(self):
         """Get Firestore client (lazy initialization)"""
         if self.firestore_client is None:
@@ -41,35 +68,125 @@ class ContextPersistenceService:
         """
         Save SessionContext to Firestore
 
+        Writes are debounced: saves arriving within SAVE_DEBOUNCE_SECONDS are
+        coalesced (only the latest context per session is kept) and written in
+        one Firestore batch. Call flush() to write pending contexts immediately.
+
         Args:
             context: SessionContext to save
 
         Returns:
-            True if successful, False otherwise
+            True if the save was scheduled, False otherwise
         """
         try:
-            client = self._get_client()
-            doc_ref = client.get_document(self._collection_name, context.session_id)
+            self.invalidate(context.session_id)
+            self._pending[context.session_id] = context
 
-            # Convert to Firestore-compatible dict
-            data = context.to_firestore_dict()
+            self._schedule_flush(SAVE_DEBOUNCE_SECONDS)
+            return True
 
-            # Store in Firestore
-            doc_ref.set(data)
+        except Exception as e:
+            logger.error(f"❌ Failed to save SessionContext to Firestore: {e}")
+            logger.warning(
+                "⚠️  Continuing without persistence (context will not be recovered on failure)"
+            )
+            return False
 
-            logger.info(f"💾 Saved SessionContext to Firestore: {context.session_id}")
-            logger.debug(f"   Completed agents: {context.completed_agents}")
-            logger.debug(f"   Workflow status: {context.workflow_status}")
+    def _schedule_flush(self, delay: float) -> None:
+        """Schedule a flush after delay seconds unless one is already scheduled"""
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                delay, self._start_flush
+            )
+
+    def _start_flush(self) -> None:
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self) -> bool:
+        """
+        Write all pending contexts to Firestore in a single batch
+
+        If the commit fails, the contexts are queued again (unless a newer
+        save for the same session arrived meanwhile) and retried after
+        FLUSH_RETRY_SECONDS.
+
+        Flushes are serialized: a flush waits for the batch already being
+        committed, so an older batch can never land after a newer one.
+
+        Returns:
+            True if successful (or nothing was pending), False otherwise
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._flush_lock:
+            return await self._commit_pending()
+
+    async def _commit_pending(self) -> bool:
+        """Commit the pending contexts as one batch (caller holds the lock)"""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return True
+
+        # Served by load_context until the commit completes
+        self._flushing = pending
+        try:
+            client = self._get_client()
+            batch = client.client.batch()
+            for session_id, context in pending.items():
+                # Convert to Firestore-compatible dict
+                batch.set(
+                    client.get_document(self._collection_name, session_id),
+                    context.to_firestore_dict(),
+                )
+
+            # Store in Firestore (one RPC for every pending session)
+            await asyncio.to_thread(batch.commit)
+
+            for session_id, context in pending.items():
+                logger.info(f"💾 Saved SessionContext to Firestore: {session_id}")
+                logger.debug(f"   Completed agents: {context.completed_agents}")
+                logger.debug(f"   Workflow status: {context.workflow_status}")
 
             return True
 
         except Exception as e:
             logger.error(f"❌ Failed to save SessionContext to Firestore: {e}")
+            for session_id, context in pending.items():
+                self._pending.setdefault(session_id, context)
             logger.warning(
-                "⚠️  Continuing without persistence (context will not be recovered on failure)"
+                f"⚠️  Retrying {len(pending)} SessionContext save(s) "
+                f"in {FLUSH_RETRY_SECONDS}s"
             )
+            self._schedule_flush(FLUSH_RETRY_SECONDS)
             return False
 
+        finally:
+            self._flushing = {}
+
+    async def aclose(self) -> bool:
+        """
+        Write pending contexts before shutdown
+
+        Waits for an in-flight flush, then writes whatever is still pending
+        and cancels any scheduled retry.
+
+        Returns:
+            True if everything pending was written, False otherwise
+        """
+        task = self._flush_task
+        if task is not None and not task.done():
+            await task
+        self._flush_task = None
+
+        success = await self.flush()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        return success
+
     async def load_context(self, session_id: str) -> Optional[SessionContext]:
         """
         Load SessionContext from Firestore
@@ -86,6 +203,18 @@ class ContextPersistenceService:
         if not session_id:
             raise ValueError("session_id cannot be empty or None")
 
+        # A save that has not been flushed (or whose commit is still running)
+        # is newer than what Firestore holds
+        unsaved = self._pending.get(session_id) or self._flushing.get(session_id)
+        if unsaved is not None:
+            # Callers mutate contexts; don't hand out the queued payload
+            return unsaved.model_copy(deep=True)
+
+        cached = self._ctx_cache.get(session_id)
+        if cached is not None:
+            # Callers mutate contexts, so each gets its own copy
+            return cached.model_copy(deep=True)
+
         try:
             client = self._get_client()
             doc_ref = client.get_document(self._collection_name, session_id)
@@ -98,6 +227,7 @@ class ContextPersistenceService:
             # Convert from Firestore dict to SessionContext
             data = doc.to_dict()
             context = SessionContext.from_firestore_dict(data)
+            self._ctx_cache[session_id] = context.model_copy(deep=True)
 
             logger.info(f"📂 Loaded SessionContext from Firestore: {session_id}")
             logger.debug(f"   Completed agents: {context.completed_agents}")
@@ -119,10 +249,15 @@ class ContextPersistenceService:
         Returns:
             True if successful, False otherwise
         """
+        self._pending.pop(session_id, None)
+        self.invalidate(session_id)
+
         try:
             client = self._get_client()
             doc_ref = client.get_document(self._collection_name, session_id)
-            doc_ref.delete()
+            # Wait for an in-flight batch so it can't recreate the document
+            async with self._flush_lock:
+                doc_ref.delete()
 
             logger.info(f"🗑️  Deleted SessionContext from Firestore: {session_id}")
             return True
@@ -131,6 +266,15 @@ class ContextPersistenceService:
             logger.error(f"❌ Failed to delete SessionContext from Firestore: {e}")
             return False
 
+    def invalidate(self, session_id: str) -> None:
+        """
+        Drop a cached context, e.g. after another replica wrote the session
+
+        Args:
+            session_id: Session ID to invalidate
+        """
+        self._ctx_cache.pop(session_id, None)
+
     async def list_contexts(self, limit: int = 10) -> list:
         """
         List recent SessionContexts
@@ -145,9 +289,12 @@ class ContextPersistenceService:
             client = self._get_client()
             collection = client.get_collection(self._collection_name)
 
-            # Get recent documents ordered by timestamp
+            # Get recent documents ordered by timestamp. Only the IDs are used,
+            # so project onto the document name instead of fetching the
+            # full context bodies.
             docs = (
                 collection.order_by("timestamp", direction="DESCENDING")
+                .select(["__name__"])
                 .limit(limit)
                 .stream()
             )
@@ -6,9 +6,16 @@ Allows agents to emit status events that are streamed to frontend in real-time.
 """
 
 import asyncio
+import functools
+import heapq
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import orjson
 
 from backend.models.stream_event_model import (
     AgentEventPayload,
@@ -23,6 +30,43 @@ from backend.models.stream_event_model import (
 
 logger = logging.getLogger(__name__)
 
+# Aggregated stats are approximate by nature; polling dashboards share one
+# snapshot per window instead of re-aggregating every session per request.
+STATS_SNAPSHOT_TTL_SECONDS = 1.0
+
+# Most events delivered to a client in one batch (one WebSocket frame)
+EVENT_BATCH_MAX_SIZE = 128
+
+# Pending batches a client may fall behind by before batches are dropped for it
+CLIENT_QUEUE_MAXSIZE = 1024
+
+# pydantic-core serialiser for events; to_json() writes bytes directly, with
+# no str round trip through model_dump_json().encode()
+_EVENT_SERIALIZER = AgentStreamEvent.__pydantic_serializer__
+
+# Most recent events kept per session for the history endpoint
+EVENT_HISTORY_MAXSIZE = int(os.getenv("AGENTNAV_EVENT_HISTORY", "2000"))
+
+
+class _SessionLoggerAdapter(logging.LoggerAdapter):
+    """Tag an emitter's records with its session (message prefix + json_fields).
+
+    Emitters share the module logger; a getChild() logger per session would
+    stay in the logging manager's registry for the life of the process.
+    """
+
+    def process(self, msg: Any, kwargs: Any) -> Tuple[Any, Any]:
+        extra = kwargs.get("extra") or {}
+        kwargs["extra"] = {
+            **self.extra,
+            **extra,
+            "json_fields": {
+                **self.extra["json_fields"],
+                **extra.get("json_fields", {}),
+            },
+        }
+        return f"[{self.extra['json_fields']['session_id']}] {msg}", kwargs
+
 
 class EventEmitter:
     """
@@ -42,18 +86,38 @@ class EventEmitter:
         self.session_id = session_id
         self.event_queue: asyncio.Queue = asyncio.Queue()
         self.connected_clients: Set[asyncio.Queue] = set()
-        self.events_emitted: List[AgentStreamEvent] = []
-        self.start_time: float = datetime.utcnow().timestamp() * 1000
-        self.logger = logger.getChild(f"emitter.{session_id[:8]}")
+        # Events dropped for each lagging client since its last delivered batch
+        self._client_dropped: Dict[asyncio.Queue, int] = {}
+        self._seq = 0
+        self._dropped_events = 0
+        # Emitted events waiting to be batched out to clients
+        self._outbound: List[bytes] = []
+        self._flush_scheduled = False
+        # Recent events as (status, agent, serialised event), oldest dropped first
+        self.events_emitted: Deque[Tuple[str, str, bytes]] = deque(
+            maxlen=EVENT_HISTORY_MAXSIZE
+        )
+        self._total_events = 0
+        # Per-session totals, maintained on emit so get_stats never scans
+        self._status_counts: Dict[str, int] = {}
+        self._agent_counts: Dict[str, int] = {}
+        self.start_time: float = time.time() * 1000
+        self._started: float = time.monotonic()
+        self.logger = _SessionLoggerAdapter(
+            logger, {"json_fields": {"session_id": session_id}}
+        )
 
-        self.logger.info(f"📡 EventEmitter initialized for session {session_id}")
+        self.logger.info("📡 EventEmitter initialized")
 
     def register_client(self, client_queue: asyncio.Queue) -> None:
         """
         Register a new WebSocket client to receive events.
 
         Args:
-            client_queue: AsyncIO queue for sending events to client
+            client_queue: AsyncIO queue for sending events to client. Should be
+                bounded (CLIENT_QUEUE_MAXSIZE); while its queue is full,
+                batches are dropped for that client and reported to it as a
+                gap marker with the next batch it receives.
         """
         self.connected_clients.add(client_queue)
         self.logger.debug(
@@ -68,14 +132,14 @@ class EventEmitter:
             client_queue: Client queue to unregister
         """
         self.connected_clients.discard(client_queue)
+        self._client_dropped.pop(client_queue, None)
         self.logger.debug(
             f"❌ Client unregistered. Total clients: {len(self.connected_clients)}"
         )
 
     def _calculate_elapsed_ms(self) -> int:
         """Calculate milliseconds elapsed since workflow start."""
-        current_time = datetime.utcnow().timestamp() * 1000
-        return int(current_time - self.start_time)
+        return int((time.monotonic() - self._started) * 1000)
 
     async def emit_event(self, event: AgentStreamEvent | Dict[str, Any]) -> None:
         """
@@ -87,41 +151,95 @@ class EventEmitter:
         if isinstance(event, dict):
             event = AgentStreamEvent.model_validate(event)
 
-        # Update elapsed time
+        # Update elapsed time and sequence number
         event.metadata.elapsed_ms = self._calculate_elapsed_ms()
-
-        # Store event in history
-        self.events_emitted.append(event)
+        self._seq += 1
+        event.metadata.seq = self._seq
+
+        # Serialise once for history and every client
+        data = _EVENT_SERIALIZER.to_json(event)
+        status = event.status.value
+        agent = event.agent.value
+        self.events_emitted.append((status, agent, data))
+        self._total_events += 1
+        self._status_counts[status] = self._status_counts.get(status, 0) + 1
+        self._agent_counts[agent] = self._agent_counts.get(agent, 0) + 1
 
         self.logger.info(
             f"📤 Event emitted: {event.agent.value}::{event.status.value} "
             f"(step {event.metadata.step}/{event.metadata.total_steps})"
         )
 
-        # Broadcast to all connected clients
-        disconnected_clients = set()
+        # Deliver on the next loop iteration, so events emitted back to back
+        # go out as one batch. A loop callback rather than a per-session
+        # flusher task keeps idle sessions free of any scheduled work.
+        self._outbound.append(data)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._scheduled_flush)
+
+    def _scheduled_flush(self) -> None:
+        """Loop callback scheduled by emit_event."""
+        self._flush_scheduled = False
+        self.flush()
+
+    def _broadcast_batch(self, batch: List[bytes]) -> None:
+        """
+        Send a batch of serialised events to every client.
+
+        The batch is encoded once as a JSON array and the same bytes object is
+        put into every client queue. A client whose queue is full misses the
+        batch; the next batch it does receive starts with a
+        {"type": "gap", "dropped_events": n} marker so it can tell events were
+        lost (their seq numbers are missing).
+
+        Args:
+            batch: Serialised events taken from the outbound buffer
+        """
+        events = b",".join(batch)
+        payload = b"[" + events + b"]"
+
+        # Synchronous fan-out: no await (and so no task switch) per client
+        disconnected_clients: List[asyncio.Queue] = []
         for client_queue in self.connected_clients:
+            dropped = self._client_dropped.get(client_queue)
             try:
-                # Convert event to JSON-serializable dict
-                event_dict = event.model_dump(mode="json")
-                await asyncio.wait_for(client_queue.put(event_dict), timeout=5.0)
-            except asyncio.TimeoutError:
-                self.logger.warning("⚠️  Client queue full, removing client")
-                disconnected_clients.add(client_queue)
+                if dropped is None:
+                    client_queue.put_nowait(payload)
+                else:
+                    gap = orjson.dumps({"type": "gap", "dropped_events": dropped})
+                    client_queue.put_nowait(b"[" + gap + b"," + events + b"]")
+                    del self._client_dropped[client_queue]
+            except asyncio.QueueFull:
+                if dropped is None:
+                    self.logger.warning("⚠️  Client queue full, dropping events")
+                self._client_dropped[client_queue] = (dropped or 0) + len(batch)
+                self._dropped_events += len(batch)
             except Exception as e:
                 self.logger.error(f"❌ Error broadcasting to client: {e}")
-                disconnected_clients.add(client_queue)
+                disconnected_clients.append(client_queue)
 
         # Clean up disconnected clients
         for client_queue in disconnected_clients:
             self.unregister_client(client_queue)
 
+    def flush(self) -> None:
+        """Deliver all queued events to clients now, without waiting."""
+        while self._outbound:
+            batch = self._outbound[:EVENT_BATCH_MAX_SIZE]
+            del self._outbound[:EVENT_BATCH_MAX_SIZE]
+            self._broadcast_batch(batch)
+
+    def close(self) -> None:
+        """Deliver any queued events before the emitter is discarded."""
+        self.flush()
+
     # Convenience methods for specific event types
 
     async def emit_agent_queued(self, agent: AgentTypeEnum, step: int) -> None:
         """Emit agent queued event."""
         event = create_agent_queued_event(
-            agent=agent, step=step, elapsed_ms=self._calculate_elapsed_ms()
+            agent=agent, step=step, elapsed_ms=0  # stamped by emit_event
         )
         await self.emit_event(event)
 
@@ -135,7 +253,7 @@ class EventEmitter:
         event = create_agent_processing_event(
             agent=agent,
             step=step,
-            elapsed_ms=self._calculate_elapsed_ms(),
+            elapsed_ms=0,  # stamped by emit_event
             partial_results=partial_results,
         )
         await self.emit_event(event)
@@ -161,7 +279,7 @@ class EventEmitter:
         event = create_agent_complete_event(
             agent=agent,
             step=step,
-            elapsed_ms=self._calculate_elapsed_ms(),
+            elapsed_ms=0,  # stamped by emit_event
             payload=payload,
         )
         await self.emit_event(event)
@@ -179,7 +297,7 @@ class EventEmitter:
         event = create_agent_error_event(
             agent=agent,
             step=step,
-            elapsed_ms=self._calculate_elapsed_ms(),
+            elapsed_ms=0,  # stamped by emit_event
             error=error,
             error_type=error_type,
             error_details=error_details,
@@ -189,12 +307,21 @@ class EventEmitter:
 
     def get_event_history(self) -> List[Dict[str, Any]]:
         """
-        Get all events emitted so far.
+        Get the most recent events emitted (up to EVENT_HISTORY_MAXSIZE).
 
         Returns:
             List of events as dictionaries
         """
-        return [event.model_dump(mode="json") for event in self.events_emitted]
+        return [orjson.loads(data) for _, _, data in self.events_emitted]
+
+    def get_event_history_json(self) -> bytes:
+        """
+        Get the most recent events as a JSON array, without re-serializing.
+
+        Returns:
+            UTF-8 JSON array of the events returned by get_event_history()
+        """
+        return b"[" + b",".join(data for _, _, data in self.events_emitted) + b"]"
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -203,20 +330,12 @@ class EventEmitter:
         Returns:
             Dictionary with event statistics
         """
-        status_counts: Dict[str, int] = {}
-        agent_counts: Dict[str, int] = {}
-
-        for event in self.events_emitted:
-            status = event.status.value
-            agent = event.agent.value
-            status_counts[status] = status_counts.get(status, 0) + 1
-            agent_counts[agent] = agent_counts.get(agent, 0) + 1
-
         return {
-            "total_events": len(self.events_emitted),
+            "total_events": self._total_events,
             "connected_clients": len(self.connected_clients),
-            "status_breakdown": status_counts,
-            "agent_breakdown": agent_counts,
+            "dropped_events": self._dropped_events,
+            "status_breakdown": dict(self._status_counts),
+            "agent_breakdown": dict(self._agent_counts),
             "elapsed_ms": self._calculate_elapsed_ms(),
             "session_id": self.session_id,
         }
@@ -232,6 +351,12 @@ class EventEmitterManager:
     def __init__(self):
         """Initialize the event emitter manager."""
         self.emitters: Dict[str, EventEmitter] = {}
+        # (creation time, session_id), oldest first; entries for emitters
+        # already removed are skipped lazily during cleanup
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._stats_lock = threading.Lock()
+        self._stats_snapshot: Optional[Dict[str, Any]] = None
+        self._stats_snapshot_ts: float = 0.0
         self.logger = logger.getChild("manager")
         self.logger.info("🚀 EventEmitterManager initialized")
 
@@ -251,6 +376,8 @@ class EventEmitterManager:
 
         emitter = EventEmitter(session_id)
         self.emitters[session_id] = emitter
+        heapq.heappush(self._expiry_heap, (emitter._started, session_id))
+        self._stats_snapshot = None
         self.logger.info(f"✅ Created emitter for session {session_id}")
         return emitter
 
@@ -274,7 +401,8 @@ class EventEmitterManager:
             session_id: Session identifier
         """
         if session_id in self.emitters:
-            del self.emitters[session_id]
+            self.emitters.pop(session_id).close()
+            self._stats_snapshot = None
             self.logger.info(f"🗑️  Removed emitter for session {session_id}")
 
     def cleanup_inactive_emitters(self, max_age_ms: int = 3600000) -> int:
@@ -287,12 +415,14 @@ class EventEmitterManager:
         Returns:
             Number of emitters removed
         """
-        now_ms = datetime.utcnow().timestamp() * 1000
+        cutoff = time.monotonic() - max_age_ms / 1000
         expired = []
 
-        for session_id, emitter in self.emitters.items():
-            age = now_ms - emitter.start_time
-            if age > max_age_ms:
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            started, session_id = heapq.heappop(self._expiry_heap)
+            emitter = self.emitters.get(session_id)
+            # Skip sessions removed (or since recreated) after this entry
+            if emitter is not None and emitter._started == started:
                 expired.append(session_id)
 
         for session_id in expired:
@@ -307,27 +437,37 @@ class EventEmitterManager:
         """
         Get statistics for all active emitters.
 
+        The result is a shared snapshot refreshed at most once per
+        STATS_SNAPSHOT_TTL_SECONDS (or when sessions are added/removed), so
+        callers must treat it as read-only.
+
         Returns:
             Dictionary with stats for each session
         """
-        return {
-            session_id: emitter.get_stats()
-            for session_id, emitter in self.emitters.items()
-        }
-
-
-# Global singleton instance
-_emitter_manager: Optional[EventEmitterManager] = None
-
-
+        with self._stats_lock:
+            now = time.monotonic()
+            if (
+                self._stats_snapshot is not None
+                and now - self._stats_snapshot_ts < STATS_SNAPSHOT_TTL_SECONDS
+            ):
+                return self._stats_snapshot
+
+            self._stats_snapshot = {
+                session_id: emitter.get_stats()
+                for session_id, emitter in list(self.emitters.items())
+            }
+            self._stats_snapshot_ts = now
+            return self._stats_snapshot
+
+
+@functools.cache
 def get_event_emitter_manager() -> EventEmitterManager:
     """
     Get the global EventEmitterManager instance.
 
+    Cached after the first call, so later calls are a single C-level lookup.
+
     Returns:
         Singleton EventEmitterManager
     """
-    global _emitter_manager
-    if _emitter_manager is None:
-        _emitter_manager = EventEmitterManager()
-    return _emitter_manager
+    return EventEmitterManager()
@@ -3,11 +3,14 @@ Firestore Client Service
 Singleton pattern for managing Firestore database connections
 """
 
+import functools
 import logging
 import os
-from typing import Optional
+import threading
+from typing import Iterable, List, Optional, Tuple
 
 from google.cloud import firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriter
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,7 @@ class FirestoreClient:
         self._client: Optional[firestore.Client] = None
         self._project_id: Optional[str] = None
         self._database_id: Optional[str] = None
+        self._init_lock = threading.Lock()
 
     def _initialize(self):
         """
@@ -82,7 +86,9 @@ class FirestoreClient:
             Initialized Firestore client
         """
         if self._client is None:
-            self._initialize()
+            # Concurrent first callers build a single client between them
+            with self._init_lock:
+                self._initialize()
         return self._client
 
     def get_collection(self, collection_name: str):
@@ -110,22 +116,44 @@ class FirestoreClient:
         """
         return self.client.collection(collection_name).document(document_id)
 
+    def get_documents(
+        self, keys: Iterable[Tuple[str, str]]
+    ) -> List[firestore.DocumentSnapshot]:
+        """
+        Fetch several documents in a single batched read
+
+        Args:
+            keys: (collection_name, document_id) pairs
 
-# Singleton instance
-_firestore_singleton: Optional[FirestoreClient] = None
+        Returns:
+            Document snapshots (in no particular order; check snapshot.exists)
+        """
+        refs = [self.get_document(collection, doc_id) for collection, doc_id in keys]
+        if not refs:
+            return []
+        return list(self.client.get_all(refs))
 
+    def bulk_writer(self) -> BulkWriter:
+        """
+        Get a BulkWriter for large, independent writes
 
+        Returns:
+            BulkWriter that batches and parallelises writes (call close() to flush)
+        """
+        return self.client.bulk_writer()
+
+
+@functools.cache
 def get_firestore_client() -> FirestoreClient:
     """
     Get or create the global Firestore client singleton
 
+    Cached after the first call, so later calls are a single C-level lookup.
+
     Returns:
         FirestoreClient instance
     """
-    global _firestore_singleton
-    if _firestore_singleton is None:
-        _firestore_singleton = FirestoreClient()
-    return _firestore_singleton
+    return FirestoreClient()
 
 
 def get_client() -> firestore.Client:
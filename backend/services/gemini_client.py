@@ -12,23 +12,113 @@ Cloud Run.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import logging
 import os
-from typing import Any, Optional
+import struct
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Completed reasoning responses keyed by a digest of the model, prompt and
+# generation settings. Only near-deterministic calls are cached: responses
+# sampled at a higher temperature are meant to differ between calls.
+REASONING_CACHE_MAXSIZE = 1024
+REASONING_CACHE_TTL_SECONDS = 600
+REASONING_CACHE_MAX_TEMPERATURE = 0.1
+_reasoning_cache: "TTLCache[bytes, str]" = TTLCache(
+    maxsize=REASONING_CACHE_MAXSIZE, ttl=REASONING_CACHE_TTL_SECONDS
+)
+
+
+def _reasoning_cache_key(
+    model: str, prompt: str, max_tokens: int, temperature: float
+) -> bytes:
+    # Fed field by field so long prompts are hashed without first being copied
+    # into one formatted key string
+    h = hashlib.blake2b(digest_size=16)
+    h.update(model.encode("utf-8"))
+    h.update(b"\0")
+    h.update(struct.pack("<id", max_tokens, temperature))
+    h.update(prompt.encode("utf-8"))
+    return h.digest()
 
-# Flexible import: support multiple possible package layouts for the GenAI SDK.
-genai = None
-try:
-    # Preferred new layout
-    import google.genai as genai  # type: ignore
-except Exception:
+
+@functools.cache
+def _load_genai() -> Optional[Any]:
+    """Import the GenAI SDK on first use, or return None if it is missing.
+
+    Deferred so processes that never call Gemini don't pay for importing the
+    SDK (and its protobuf/grpc dependencies) at startup. Supports multiple
+    possible package layouts for the SDK.
+    """
     try:
-        import genai  # type: ignore
+        # Preferred new layout
+        import google.genai as genai  # type: ignore
     except Exception:
-        genai = None
+        try:
+            import genai  # type: ignore
+        except Exception:
+            return None
+    return genai
+
+
+# Worker threads for SDK layouts without a native asyncio API
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "16"))
+
+
+@functools.cache
+def _genai_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Dedicated pool for blocking SDK calls.
+
+    Kept apart from the default executor so long model calls neither queue
+    behind nor starve the app's other asyncio.to_thread work (Firestore etc.).
+    """
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=GEMINI_CONCURRENCY, thread_name_prefix="genai"
+    )
+
+
+# Retries for transient SDK failures (rate limiting, server errors, dropped
+# connections), with exponential backoff and jitter. Client errors other than
+# 429 are raised immediately.
+GEMINI_RETRY_ATTEMPTS = int(os.getenv("GEMINI_RETRY_ATTEMPTS", "3"))
+GEMINI_RETRY_MAX_DELAY_SECONDS = 8.0
+GEMINI_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _http_options(genai: Any) -> Optional[Any]:
+    """Return SDK HTTP options enabling retries, if the SDK supports them."""
+    types = getattr(genai, "types", None)
+    if types is None or not hasattr(types, "HttpRetryOptions"):
+        return None
+    return types.HttpOptions(
+        retry_options=types.HttpRetryOptions(
+            attempts=GEMINI_RETRY_ATTEMPTS,
+            initial_delay=0.5,
+            max_delay=GEMINI_RETRY_MAX_DELAY_SECONDS,
+            http_status_codes=list(GEMINI_RETRY_STATUS_CODES),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _generation_config(max_tokens: int, temperature: float) -> Any:
+    """Return a shared, pre-validated config for a plain generate call.
+
+    Agents reuse a handful of (max_tokens, temperature) pairs, so each config
+    is built once rather than as a fresh dict the SDK re-validates per call.
+    """
+    types = getattr(_load_genai(), "types", None)
+    if types is None or not hasattr(types, "GenerateContentConfig"):
+        return {"max_output_tokens": max_tokens, "temperature": temperature}
+    return types.GenerateContentConfig(
+        max_output_tokens=max_tokens, temperature=temperature
+    )
 
 
 class GeminiClient:
@@ -41,8 +131,10 @@ class GeminiClient:
     def __init__(self, client: Optional[Any] = None):
         if client is not None:
             self._client = client
+            self._resolve_sdk_methods()
             return
 
+        genai = _load_genai()
         if genai is None:
             raise RuntimeError(
                 "google-genai SDK is not installed. Install `google-genai` in requirements."
@@ -51,8 +143,13 @@ class GeminiClient:
         # Prefer an explicit Client() constructor if available
         ClientCtor = getattr(genai, "Client", None)
         if callable(ClientCtor):
+            http_options = _http_options(genai)
             try:
-                self._client = ClientCtor()
+                self._client = (
+                    ClientCtor(http_options=http_options)
+                    if http_options is not None
+                    else ClientCtor()
+                )
             except Exception:
                 # Fall back to using module as client
                 self._client = genai
@@ -60,8 +157,38 @@ class GeminiClient:
             # Some SDK versions expose top-level helpers; use module directly
             self._client = genai
 
+        self._resolve_sdk_methods()
         logger.info("Initialized Gemini client wrapper")
 
+    def _resolve_sdk_methods(self) -> None:
+        """Look up the SDK entry points once rather than on every call."""
+        # google-genai's native asyncio API (client.aio.models.generate_content)
+        aio_models = getattr(getattr(self._client, "aio", None), "models", None)
+        self._async_generate = getattr(aio_models, "generate_content", None)
+        self._async_generate_stream = getattr(
+            aio_models, "generate_content_stream", None
+        )
+
+        # Synchronous fallbacks, in order of preference: client.models.generate
+        # (newer SDKs), client.generate / genai.generate, then generate_text
+        # (older variants)
+        self._sync_generate = (
+            getattr(getattr(self._client, "models", None), "generate", None)
+            or getattr(self._client, "generate", None)
+            or getattr(self._client, "generate_text", None)
+        )
+
+        if self._async_generate is None and self._sync_generate is None:
+            raise RuntimeError("Unsupported or unknown google-genai client interface")
+
+    async def aclose(self) -> None:
+        """Close the SDK's pooled HTTP connections (async and sync)."""
+        aio = getattr(self._client, "aio", None)
+        if callable(getattr(aio, "aclose", None)):
+            await aio.aclose()
+        if callable(getattr(self._client, "close", None)):
+            self._client.close()
+
     async def generate(
         self,
         model: Optional[str],
@@ -72,54 +199,91 @@ class GeminiClient:
     ) -> Any:
         """Generate text from the specified model.
 
-        This method attempts several common call signatures for different SDK
-        versions. The call is run in a thread to avoid blocking if the SDK is
-        synchronous.
+        Clients exposing google-genai's native asyncio API (``client.aio``) are
+        awaited directly, so no worker thread is held for the length of the
+        model call. Otherwise this attempts several common call signatures for
+        different SDK versions, run on a dedicated thread pool to avoid blocking
+        if the SDK is synchronous.
         """
+        if self._async_generate is not None:
+            try:
+                return await self._async_generate(
+                    model=model,
+                    contents=prompt,
+                    config=(
+                        {
+                            "max_output_tokens": max_tokens,
+                            "temperature": temperature,
+                            **kwargs,
+                        }
+                        if kwargs
+                        else _generation_config(max_tokens, temperature)
+                    ),
+                )
+            except Exception as e:
+                logger.exception("Error while calling GenAI SDK: %s", e)
+                raise
 
         def _sync_call():
-            # Try client.models.generate(model=..., prompt=...)
             try:
-                if hasattr(self._client, "models") and hasattr(
-                    self._client.models, "generate"
-                ):
-                    # Newer SDKs (module.client.models.generate)
-                    return self._client.models.generate(
-                        model=model,
-                        prompt=prompt,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                        **kwargs,
-                    )
-
-                # genai.generate(...) or client.generate(...)
-                if hasattr(self._client, "generate"):
-                    return self._client.generate(
-                        model=model,
-                        prompt=prompt,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                        **kwargs,
-                    )
-
-                # Older variants
-                if hasattr(self._client, "generate_text"):
-                    return self._client.generate_text(
-                        model=model,
-                        prompt=prompt,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                        **kwargs,
-                    )
-
+                return self._sync_generate(
+                    model=model,
+                    prompt=prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs,
+                )
             except Exception as e:
                 # Surface SDK errors
                 logger.exception("Error while calling GenAI SDK: %s", e)
                 raise
 
-            raise RuntimeError("Unsupported or unknown google-genai client interface")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_genai_executor(), _sync_call)
+
+    async def generate_stream(
+        self,
+        model: Optional[str],
+        prompt: str,
+        max_tokens: int = 256,
+        temperature: float = 0.0,
+    ) -> AsyncIterator[Any]:
+        """Yield response chunks from the specified model as they arrive.
+
+        Uses google-genai's ``client.aio.models.generate_content_stream``. SDK
+        layouts without a streaming API fall back to a single chunk holding
+        the complete ``generate`` response.
+        """
+        if self._async_generate_stream is None:
+            yield await self.generate(
+                model=model,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            return
+
+        try:
+            stream = await self._async_generate_stream(
+                model=model,
+                contents=prompt,
+                config=_generation_config(max_tokens, temperature),
+            )
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            logger.exception("Error while streaming from GenAI SDK: %s", e)
+            raise
 
-        return await asyncio.to_thread(_sync_call)
+
+@functools.cache
+def get_gemini_client() -> GeminiClient:
+    """Return the shared GeminiClient, creating it on first use.
+
+    The model is chosen per call, so one SDK client serves every model and
+    the SDK's HTTP connection pool is reused across requests.
+    """
+    return GeminiClient()
 
 
 async def reason_with_gemini(
@@ -141,42 +305,105 @@ async def reason_with_gemini(
         model: Optional explicit model name. Defaults to "gemini-1" or GEMINI_MODEL env var.
 
     Returns:
-        The text response from Gemini.
+        The text response from Gemini. Calls with temperature at or below
+        REASONING_CACHE_MAX_TEMPERATURE are answered from a short-lived cache
+        when the same model, prompt and settings were seen recently.
 
     Raises:
         RuntimeError: If Gemini client fails to generate response.
     """
     # Use cloud Gemini via GenAI SDK
     model = model or os.environ.get("GEMINI_MODEL") or "gemini-1"
-    client = GeminiClient()
+
+    cache_key = None
+    if temperature <= REASONING_CACHE_MAX_TEMPERATURE:
+        cache_key = _reasoning_cache_key(model, prompt, max_tokens, temperature)
+        cached = _reasoning_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("✅ Reasoning cache hit")
+            return cached
+
+    client = get_gemini_client()
     result = await client.generate(
         model=model, prompt=prompt, max_tokens=max_tokens, temperature=temperature
     )
 
-    # Normalize a few common SDK return shapes
-    # - Newer SDKs may return an object with .candidates or .output
-    if isinstance(result, dict):
-        # common pattern: {'candidates': [{'content': {'text': '...'}}]}
-        candidates = result.get("candidates") or result.get("outputs")
-        if isinstance(candidates, list) and len(candidates) > 0:
-            first = candidates[0]
-            # nested content
-            content = first.get("content") or first.get("output") or first
-            if isinstance(content, dict):
-                text = content.get("text") or content.get("content")
-                if text:
-                    logger.info(
-                        f"✅ Used Gemini service for reasoning (max_tokens={max_tokens})"
-                    )
-                    return text
-            # fallback to string representation
-            return str(first)
-
-    # If result is a string-like return it
-    if isinstance(result, str):
-        logger.info(f"✅ Used Gemini service for reasoning (max_tokens={max_tokens})")
-        return result
+    text = _response_text(result, max_tokens)
+    if cache_key is not None:
+        _reasoning_cache[cache_key] = text
+    return text
+
 
+async def stream_with_gemini(
+    prompt: str,
+    max_tokens: int = 256,
+    temperature: float = 0.0,
+    model: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """Streaming counterpart of ``reason_with_gemini``.
+
+    Yields text fragments as Gemini generates them, so callers can start on
+    the first tokens instead of waiting for (and holding) the whole response.
+    Streamed responses bypass the reasoning cache.
+
+    Args:
+        prompt: The reasoning prompt to send.
+        max_tokens: Maximum tokens in the response.
+        temperature: Sampling temperature (0.0 = deterministic, higher = more creative).
+        model: Optional explicit model name. Defaults to "gemini-1" or GEMINI_MODEL env var.
+
+    Yields:
+        Non-empty text fragments in generation order.
+
+    Raises:
+        RuntimeError: If Gemini client fails to generate response.
+    """
+    model = model or os.environ.get("GEMINI_MODEL") or "gemini-1"
+
+    client = get_gemini_client()
+    async for chunk in client.generate_stream(
+        model=model, prompt=prompt, max_tokens=max_tokens, temperature=temperature
+    ):
+        text = chunk if isinstance(chunk, str) else getattr(chunk, "text", None)
+        if text:
+            yield text
+
+
+def _text_from_dict(result: Dict[str, Any]) -> str:
+    # common pattern: {'candidates': [{'content': {'text': '...'}}]}
+    candidates = result.get("candidates") or result.get("outputs")
+    if isinstance(candidates, list) and candidates:
+        first = candidates[0]
+        # nested content
+        content = first.get("content") or first.get("output") or first
+        if isinstance(content, dict):
+            text = content.get("text") or content.get("content")
+            if text:
+                return text
+        # fallback to string representation
+        return str(first)
+    return str(result)
+
+
+def _text_from_object(result: Any) -> str:
+    # google-genai GenerateContentResponse exposes the generated text directly
+    text = getattr(result, "text", None)
+    if isinstance(text, str):
+        return text
     # Last resort: return stringified result
-    logger.info(f"✅ Used Gemini service for reasoning (max_tokens={max_tokens})")
     return str(result)
+
+
+# Response normalizers keyed on the exact response type; anything else
+# (SDK response objects) goes through _text_from_object
+_RESPONSE_NORMALIZERS: Dict[type, Callable[[Any], str]] = {
+    str: str,
+    dict: _text_from_dict,
+}
+
+
+def _response_text(result: Any, max_tokens: int) -> str:
+    """Extract the generated text from a GenAI SDK response."""
+    text = _RESPONSE_NORMALIZERS.get(type(result), _text_from_object)(result)
+    logger.info(f"✅ Used Gemini service for reasoning (max_tokens={max_tokens})")
+    return text
@@ -4,23 +4,54 @@ Manages knowledge cache in Firestore 'knowledge_cache/' collection
 Implements content hash-based caching to avoid redundant processing
 """
 
+import asyncio
+import copy
 import hashlib
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
 
+from cachetools import TTLCache
 from google.cloud.firestore import Increment
 
 logger = logging.getLogger(__name__)
 
+# Entries recently read or written by this instance, keyed by content hash, so
+# repeat lookups for hot content skip the Firestore round trip
+LOCAL_CACHE_MAXSIZE = 1024
+LOCAL_CACHE_TTL_SECONDS = 300
+
+# Version of generate_content_hash stored with each entry (1 was SHA-256 over
+# "type:content", written without a hash_version field). Entries from older
+# versions sit under document IDs no lookup produces and are purged by
+# purge_legacy_entries().
+CONTENT_HASH_VERSION = 2
+
+
+def _is_expired(expires_at: Any, now: datetime) -> bool:
+    """Whether an entry's expires_at has passed
+
+    expires_at is a timestamp so Firestore's TTL policy can delete expired
+    entries server-side; entries written before that hold epoch seconds.
+    """
+    if not expires_at:
+        return False
+    if isinstance(expires_at, datetime):
+        return expires_at < now
+    return expires_at < now.timestamp()
+
 
 class KnowledgeCacheService:
     """
     Service for managing knowledge cache in Firestore
 
     Stores cached analysis results in the 'knowledge_cache/' collection.
-    Uses content hash (SHA256) as document ID to enable fast cache lookups.
-    Implements TTL-based expiration to manage storage costs.
+    Uses content hash (BLAKE2b) as document ID to enable fast cache lookups.
+    Implements TTL-based expiration to manage storage costs: entries carry an
+    expires_at timestamp that a Firestore TTL policy on the collection
+    (terraform/firestore.tf) deletes server-side, up to ~24h after expiry.
+    Reads check expires_at themselves to cover that lag.
     """
 
     def __init__(self, firestore_client=None, default_ttl_hours: int = 168):
@@ -34,6 +65,11 @@ class KnowledgeCacheService:
         self.firestore_client = firestore_client
         self._collection_name = "knowledge_cache"
         self.default_ttl_hours = default_ttl_hours
+        self._local_cache: "TTLCache[str, Dict[str, Any]]" = TTLCache(
+            maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL_SECONDS
+        )
+        # Hit-count writes in flight (referenced so they aren't garbage collected)
+        self._pending_writes: Set[asyncio.Task] = set()
 
     def _get_client(self):
         """Get Firestore client (lazy initialization)"""
@@ -47,28 +83,41 @@ class KnowledgeCacheService:
         self, content: str, content_type: str = "document"
     ) -> str:
         """
-        Generate SHA256 hash for content
+        Generate BLAKE2b hash for content
+
+        The hash only keys cache documents, so it doesn't need SHA-256; BLAKE2b
+        is faster on large inputs. Type and content are fed to the hasher
+        separately instead of being joined into one copy of the content first.
 
         Args:
             content: Content to hash
             content_type: Type of content (included in hash for differentiation)
 
         Returns:
-            Hexadecimal hash string
+            Hexadecimal hash string (64 characters)
         """
-        # Combine content and type for hash to differentiate same text analyzed differently
-        hash_input = f"{content_type}:{content}"
-        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+        # Include the type to differentiate same text analyzed differently
+        h = hashlib.blake2b(digest_size=32)
+        h.update(content_type.encode("utf-8"))
+        h.update(b":")
+        h.update(content.encode("utf-8"))
+        return h.hexdigest()
 
     async def check_cache(
-        self, content: str, content_type: str = "document"
+        self, content: str, content_type: str = "document", record_hit: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Check if cached result exists for content
 
+        Entries this instance read or wrote within LOCAL_CACHE_TTL_SECONDS are
+        served from memory. A hit also increments the entry's hit count through the same document
+        reference. The write runs in the background so the caller doesn't wait
+        for a second Firestore round trip.
+
         Args:
             content: Content to check
             content_type: Type of content
+            record_hit: Whether a hit should count towards the entry's hit_count
 
         Returns:
             Cached result dictionary if found and not expired, None otherwise
@@ -78,17 +127,19 @@ class KnowledgeCacheService:
 
             client = self._get_client()
             doc_ref = client.get_document(self._collection_name, content_hash)
-            doc = doc_ref.get()
 
-            if not doc.exists:
-                logger.info(f"🔍 Cache MISS: {content_hash[:16]}...")
-                return None
+            cached_data = self._local_cache.get(content_hash)
+            if cached_data is None:
+                doc = doc_ref.get()
 
-            cached_data = doc.to_dict()
+                if not doc.exists:
+                    logger.info(f"🔍 Cache MISS: {content_hash[:16]}...")
+                    return None
+
+                cached_data = doc.to_dict()
 
             # Check if cache entry has expired
-            expires_at = cached_data.get("expires_at")
-            if expires_at and expires_at < time.time():
+            if _is_expired(cached_data.get("expires_at"), datetime.now(timezone.utc)):
                 logger.info(f"⏰ Cache EXPIRED: {content_hash[:16]}...")
                 # Delete expired entry
                 await self.delete_cache_entry(content_hash)
@@ -96,8 +147,13 @@ class KnowledgeCacheService:
 
             logger.info(f"✅ Cache HIT: {content_hash[:16]}...")
             logger.debug(f"   Cached at: {cached_data.get('created_at')}")
+            self._local_cache[content_hash] = cached_data
+
+            if record_hit:
+                self._record_hit(doc_ref, content_hash)
 
-            return cached_data
+            # Callers may mutate the result; keep the shared entry intact
+            return copy.deepcopy(cached_data)
 
         except Exception as e:
             logger.error(f"❌ Failed to check cache: {e}")
@@ -135,9 +191,10 @@ class KnowledgeCacheService:
             client = self._get_client()
             doc_ref = client.get_document(self._collection_name, content_hash)
 
-            # Calculate expiration time
+            # Calculate expiration time (a timestamp, for the TTL policy)
             current_time = time.time()
-            expires_at = current_time + (ttl * 3600)  # Convert hours to seconds
+            created = datetime.fromtimestamp(current_time, tz=timezone.utc)
+            expires_at = created + timedelta(hours=ttl)
 
             cache_data = {
                 "content_hash": content_hash,
@@ -150,9 +207,12 @@ class KnowledgeCacheService:
                 "expires_at": expires_at,
                 "ttl_hours": ttl,
                 "hit_count": 0,  # Track cache hits
+                "hash_version": CONTENT_HASH_VERSION,
             }
 
             doc_ref.set(cache_data)
+            # Copied so later changes to the caller's objects don't leak in
+            self._local_cache[content_hash] = copy.deepcopy(cache_data)
 
             logger.info(f"💾 Stored in cache: {content_hash[:16]}...")
             logger.debug(f"   TTL: {ttl} hours")
@@ -165,6 +225,23 @@ class KnowledgeCacheService:
             logger.warning("⚠️  Continuing without caching")
             return False
 
+    def _record_hit(self, doc_ref: Any, content_hash: str) -> None:
+        """Increment an entry's hit count without blocking the caller"""
+
+        async def _update() -> None:
+            try:
+                await asyncio.to_thread(
+                    doc_ref.update,
+                    {"hit_count": Increment(1), "last_accessed_at": time.time()},
+                )
+                logger.debug(f"📊 Incremented hit count for {content_hash[:16]}...")
+            except Exception as e:
+                logger.error(f"❌ Failed to increment hit count: {e}")
+
+        task = asyncio.get_running_loop().create_task(_update())
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
     async def increment_hit_count(self, content_hash: str) -> bool:
         """
         Increment hit count for cache entry
@@ -202,6 +279,7 @@ class KnowledgeCacheService:
         try:
             client = self._get_client()
             doc_ref = client.get_document(self._collection_name, content_hash)
+            self._local_cache.pop(content_hash, None)
             doc_ref.delete()
 
             logger.info(f"🗑️  Deleted cache entry: {content_hash[:16]}...")
@@ -215,8 +293,18 @@ class KnowledgeCacheService:
         """
         Clean up expired cache entries
 
+        Firestore's TTL policy on expires_at deletes expired entries in the
+        background, so for current entries this is only needed where that
+        policy isn't configured (e.g. the emulator). Entries written before
+        expires_at became a timestamp hold epoch seconds, which the TTL policy
+        ignores and timestamp queries never match; a second pass deletes those.
+
+        Deletes page by page until no expired entries remain, so a backlog is
+        drained in one call. Only document names are fetched for each page.
+
         Args:
             batch_size: Maximum number of entries to delete in one batch
+                (capped at Firestore's limit of 500 writes per batch)
 
         Returns:
             Number of entries deleted
@@ -225,18 +313,20 @@ class KnowledgeCacheService:
             client = self._get_client()
             collection = client.get_collection(self._collection_name)
 
-            # Query for expired entries
-            current_time = time.time()
-            expired_docs = (
-                collection.where("expires_at", "<", current_time)
-                .limit(batch_size)
-                .stream()
-            )
-
+            # Firestore range filters only match values of the filter's type,
+            # so timestamp and legacy epoch-second entries are queried apart
+            batch_size = min(batch_size, 500)
             deleted_count = 0
-            for doc in expired_docs:
-                doc.reference.delete()
-                deleted_count += 1
+            for now in (datetime.now(timezone.utc), time.time()):
+                # Names only: an empty projection
+                expired_query = (
+                    collection.where("expires_at", "<", now)
+                    .select([])
+                    .limit(batch_size)
+                )
+                deleted_count += await self._delete_query_results(
+                    expired_query, batch_size
+                )
 
             if deleted_count > 0:
                 logger.info(f"🧹 Cleaned up {deleted_count} expired cache entries")
@@ -247,6 +337,77 @@ class KnowledgeCacheService:
             logger.error(f"❌ Failed to cleanup expired entries: {e}")
             return 0
 
+    async def purge_legacy_entries(self, batch_size: int = 100) -> int:
+        """
+        Delete entries keyed by an older content hash version
+
+        Such entries can never be hit again, so they are removed without
+        waiting for them to expire. Unversioned (SHA-256) entries predate the
+        hash_version field and are recognised by their epoch-second expires_at,
+        a value the current version never writes.
+
+        Args:
+            batch_size: Maximum number of entries to delete in one batch
+                (capped at Firestore's limit of 500 writes per batch)
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            client = self._get_client()
+            collection = client.get_collection(self._collection_name)
+
+            batch_size = min(batch_size, 500)
+            legacy_queries = (
+                # Any numeric expires_at (range filters only match numbers)
+                collection.where("expires_at", "<", float("inf")),
+                collection.where("hash_version", "<", CONTENT_HASH_VERSION),
+            )
+
+            deleted_count = 0
+            for query in legacy_queries:
+                deleted_count += await self._delete_query_results(
+                    query.select([]).limit(batch_size), batch_size
+                )
+
+            if deleted_count > 0:
+                logger.info(f"🧹 Purged {deleted_count} legacy cache entries")
+
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"❌ Failed to purge legacy entries: {e}")
+            return 0
+
+    async def _delete_query_results(self, query: Any, batch_size: int) -> int:
+        """
+        Delete every document a limited query returns, one batch per page
+
+        Args:
+            query: Query limited to batch_size documents
+            batch_size: The query's limit
+
+        Returns:
+            Number of documents deleted
+        """
+        client = self._get_client()
+        deleted_count = 0
+        while True:
+            # Delete the whole page in one commit rather than one RPC per
+            # entry; deleted entries drop out of the next page's query
+            batch = client.client.batch()
+            page_count = 0
+            for doc in query.stream():
+                batch.delete(doc.reference)
+                page_count += 1
+
+            if page_count > 0:
+                await asyncio.to_thread(batch.commit)
+            deleted_count += page_count
+
+            if page_count < batch_size:
+                return deleted_count
+
     async def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics
@@ -258,22 +419,22 @@ class KnowledgeCacheService:
             client = self._get_client()
             collection = client.get_collection(self._collection_name)
 
-            # Get all cache entries (limited for performance)
+            # Get all cache entries (limited for performance), fetching only
+            # the fields counted here rather than the cached results
             # Limit can be made configurable via constructor parameter if needed
-            docs = collection.limit(1000).stream()
+            docs = collection.select(["expires_at", "hit_count"]).limit(1000).stream()
 
             total_entries = 0
             total_hits = 0
             expired_entries = 0
-            current_time = time.time()
+            now = datetime.now(timezone.utc)
 
             for doc in docs:
                 total_entries += 1
                 data = doc.to_dict()
                 total_hits += data.get("hit_count", 0)
 
-                expires_at = data.get("expires_at")
-                if expires_at and expires_at < current_time:
+                if _is_expired(data.get("expires_at"), now):
                     expired_entries += 1
 
             return {
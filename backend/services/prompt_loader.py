@@ -5,8 +5,9 @@ Loads and caches agent prompts from Firestore
 
 import logging
 import threading
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
+
+from cachetools import TTLCache
 
 from .firestore_client import get_firestore_client
 
@@ -14,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 # Cache configuration
 CACHE_TTL_SECONDS = 300  # 5 minutes
+CACHE_MAXSIZE = 256
 
 
 class PromptCache:
@@ -21,7 +23,10 @@ class PromptCache:
 
     def __init__(self, ttl_seconds: int = CACHE_TTL_SECONDS):
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, dict] = {}
+        # Expiry is tracked on the monotonic clock and checked lazily on access
+        self._cache: "TTLCache[str, str]" = TTLCache(
+            maxsize=CACHE_MAXSIZE, ttl=ttl_seconds
+        )
         self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[str]:
@@ -35,17 +40,7 @@ class PromptCache:
             Cached value or None if expired/not found
         """
         with self._lock:
-            if key not in self._cache:
-                return None
-
-            entry = self._cache[key]
-            if datetime.now() > entry["expires_at"]:
-                # Cache expired
-                del self._cache[key]
-                logger.debug(f"Cache expired for: {key}")
-                return None
-
-            return entry["value"]
+            return self._cache.get(key)
 
     def set(self, key: str, value: str):
         """
@@ -56,10 +51,7 @@ class PromptCache:
             value: Value to cache
         """
         with self._lock:
-            self._cache[key] = {
-                "value": value,
-                "expires_at": datetime.now() + timedelta(seconds=self.ttl_seconds),
-            }
+            self._cache[key] = value
         logger.debug(f"Cached prompt: {key} (TTL: {self.ttl_seconds}s)")
 
     def clear(self):
@@ -76,8 +68,7 @@ class PromptCache:
             key: Cache key to invalidate
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            if self._cache.pop(key, None) is not None:
                 logger.debug(f"Invalidated cache for: {key}")
 
 
@@ -155,6 +146,41 @@ class PromptLoaderService:
             logger.error(f"Error loading prompt {prompt_id}: {e}")
             raise
 
+    def get_prompts(self, prompt_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Load several prompts, fetching all cache misses in one Firestore read
+
+        Args:
+            prompt_ids: Document IDs in agent_prompts collection
+
+        Returns:
+            Mapping of prompt ID to prompt text. Prompts that are missing or
+            have an empty prompt_text are left out.
+        """
+        prompts: Dict[str, str] = {}
+        missing = []
+        for prompt_id in prompt_ids:
+            cached_prompt = self.cache.get(prompt_id)
+            if cached_prompt is not None:
+                prompts[prompt_id] = cached_prompt
+            else:
+                missing.append(prompt_id)
+
+        if missing:
+            logger.info(f"Loading {len(missing)} prompts from Firestore")
+            snapshots = self.firestore_client.get_documents(
+                (self.collection_name, prompt_id) for prompt_id in missing
+            )
+            for doc in snapshots:
+                if not doc.exists:
+                    continue
+                prompt_text = doc.to_dict().get("prompt_text", "")
+                if prompt_text:
+                    self.cache.set(doc.id, prompt_text)
+                    prompts[doc.id] = prompt_text
+
+        return prompts
+
     def reload_prompt(self, prompt_id: str) -> str:
         """
         Force reload a prompt from Firestore (bypass cache)
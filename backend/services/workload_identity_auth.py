@@ -9,15 +9,22 @@ service-to-service authentication.
 from __future__ import annotations
 
 import os
+import threading
 from functools import lru_cache
 from typing import Any, Dict, Optional
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
+from google.auth import jwt as google_jwt
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 
 _AUTH_HEADER_PREFIX = "bearer "
 
+# Google rotates its ID-token signing keys on a days-long schedule and publishes
+# new keys well before using them, so a few minutes of reuse is safe.
+CERTS_CACHE_TTL_SECONDS = 300
+
 
 def _strtobool(value: Optional[str]) -> bool:
     if value is None:
@@ -32,21 +39,73 @@ def require_workload_identity() -> bool:
 
 
 @lru_cache(maxsize=1)
-def _trusted_service_accounts() -> Optional[set[str]]:
+def _trusted_service_accounts() -> Optional[frozenset[str]]:
     raw = os.getenv("TRUSTED_SERVICE_ACCOUNTS")
     if not raw:
         return None
 
-    accounts = {item.strip().lower() for item in raw.split(",") if item.strip()}
+    accounts = frozenset(
+        item.strip().lower() for item in raw.split(",") if item.strip()
+    )
     return accounts or None
 
 
+def _unverified_email(token: str) -> Optional[str]:
+    """Read the email claim without checking the signature.
+
+    Only used to reject callers early; a token is never accepted on the basis
+    of unverified claims.
+    """
+
+    try:
+        claims = google_jwt.decode(token, verify=False)
+    except Exception:  # noqa: BLE001 - malformed tokens fall through to verify
+        return None
+
+    email = claims.get("email")
+    return email if isinstance(email, str) else None
+
+
 def _expected_audience() -> Optional[str]:
     return os.getenv("EXPECTED_AUDIENCE") or os.getenv("WI_EXPECTED_AUDIENCE")
 
 
+class _CertsCachingRequest(google_requests.Request):
+    """Transport that reuses successful GET responses for a few minutes.
+
+    Only used to fetch Google's public signing certs, which
+    verify_oauth2_token otherwise downloads on every call.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._responses: TTLCache = TTLCache(maxsize=8, ttl=CERTS_CACHE_TTL_SECONDS)
+        self._lock = threading.Lock()
+
+    def __call__(self, url, method="GET", **kwargs):  # type: ignore[override]
+        if method != "GET":
+            return super().__call__(url, method=method, **kwargs)
+
+        with self._lock:
+            response = self._responses.get(url)
+        if response is None:
+            response = super().__call__(url, method=method, **kwargs)
+            if response.status == 200:
+                with self._lock:
+                    self._responses[url] = response
+        return response
+
+
+@lru_cache(maxsize=1)
 def _build_google_request() -> google_requests.Request:
-    return google_requests.Request()
+    """Shared transport for fetching Google's certs.
+
+    Request() wraps its own requests.Session; reusing one keeps the pooled
+    keep-alive connection instead of a new TCP+TLS handshake per verification,
+    and the certs themselves are cached for CERTS_CACHE_TTL_SECONDS.
+    """
+
+    return _CertsCachingRequest()
 
 
 def _extract_bearer_token(request: Request) -> Optional[str]:
@@ -83,6 +142,17 @@ async def verify_workload_identity(request: Request) -> Dict[str, Any]:
             )
         return {"authenticated": False, "email": None, "audience": None}
 
+    # Reject untrusted callers before fetching Google's certs and running RSA
+    # verification, which keeps the unauthenticated path to a set lookup.
+    trusted_accounts = _trusted_service_accounts()
+    if trusted_accounts is not None:
+        claimed_email = _unverified_email(token)
+        if claimed_email is not None and claimed_email.lower() not in trusted_accounts:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Caller service account is not allowed",
+            )
+
     audience = _expected_audience()
 
     try:
@@ -104,7 +174,6 @@ async def verify_workload_identity(request: Request) -> Dict[str, Any]:
             detail="Workload Identity token missing email claim",
         )
 
-    trusted_accounts = _trusted_service_accounts()
     if trusted_accounts is not None and email.lower() not in trusted_accounts:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
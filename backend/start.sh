@@ -20,6 +20,8 @@ echo "👷 Workers: ${WORKERS}"
 # --workers: Single worker optimal for Cloud Run's CPU allocation
 # --host 0.0.0.0: Required for Cloud Run container networking
 # --port: Uses PORT env var from Cloud Run
+# --loop uvloop: libuv-based event loop (installed with uvicorn[standard]);
+#   fail fast rather than silently falling back to asyncio if it goes missing
 # --timeout-keep-alive: Increased for Cloud Run's load balancer (default: 5s)
 # --timeout-graceful-shutdown: Allows graceful shutdown on SIGTERM
 # --log-level: Production logging level
@@ -28,6 +30,7 @@ exec uvicorn main:app \
     --host 0.0.0.0 \
     --port "${PORT}" \
     --workers "${WORKERS}" \
+    --loop uvloop \
     --timeout-keep-alive 65 \
     --timeout-graceful-shutdown 30 \
     --log-level info \
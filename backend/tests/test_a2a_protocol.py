@@ -0,0 +1,496 @@
+"""Queueing behaviour of the A2A Protocol service."""
+
+from __future__ import annotations
+
+import logging
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.models.a2a_messages import A2AMessagePriority
+from backend.services.a2a_protocol import (
+    A2AProtocolService,
+    create_knowledge_transfer_message,
+    create_status_message,
+    create_task_delegation_message,
+)
+
+
+@pytest.fixture
+def protocol() -> A2AProtocolService:
+    return A2AProtocolService(session_id="test-a2a-session")
+
+
+def _knowledge(protocol, to_agent, priority=A2AMessagePriority.MEDIUM):
+    return create_knowledge_transfer_message(
+        from_agent="orchestrator",
+        to_agent=to_agent,
+        knowledge_type="context",
+        knowledge_data={},
+        correlation_id=protocol.correlation_id,
+        priority=priority,
+    )
+
+
+@pytest.mark.asyncio
+async def test_messages_delivered_only_to_recipient(protocol) -> None:
+    await protocol.send_message(_knowledge(protocol, "linker"))
+    await protocol.send_message(_knowledge(protocol, "summarizer"))
+
+    linker_messages = await protocol.get_messages_for_agent("linker")
+
+    assert [msg.to_agent for msg in linker_messages] == ["linker"]
+    assert protocol.get_protocol_stats()["pending_messages"] == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_is_claimed_once(protocol) -> None:
+    await protocol.send_message(
+        create_status_message(
+            from_agent="orchestrator",
+            agent_status="started",
+            correlation_id=protocol.correlation_id,
+        )
+    )
+
+    assert len(await protocol.get_messages_for_agent("linker")) == 1
+    assert await protocol.get_messages_for_agent("visualizer") == []
+
+
+@pytest.mark.asyncio
+async def test_messages_returned_by_priority(protocol) -> None:
+    low = _knowledge(protocol, "linker", A2AMessagePriority.LOW)
+    critical = _knowledge(protocol, "linker", A2AMessagePriority.CRITICAL)
+    medium = _knowledge(protocol, "linker")
+    for message in (low, critical, medium):
+        await protocol.send_message(message)
+
+    messages = await protocol.get_messages_for_agent("linker")
+
+    assert [msg.message_id for msg in messages] == [
+        critical.message_id,
+        medium.message_id,
+        low.message_id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_type_filter_leaves_other_messages_queued(protocol) -> None:
+    await protocol.send_message(_knowledge(protocol, "summarizer"))
+    await protocol.send_message(
+        create_task_delegation_message(
+            from_agent="orchestrator",
+            to_agent="summarizer",
+            task_name="create_summary",
+            task_parameters={},
+            expected_output="summary",
+            correlation_id=protocol.correlation_id,
+        )
+    )
+
+    tasks = await protocol.get_messages_for_agent(
+        "summarizer", message_types=["task_delegation"]
+    )
+    remaining = await protocol.get_messages_for_agent("summarizer")
+
+    assert [msg.message_type for msg in tasks] == ["task_delegation"]
+    assert [msg.message_type for msg in remaining] == ["knowledge_transfer"]
+
+
+@pytest.mark.asyncio
+async def test_direct_and_broadcast_messages_merged_by_priority(protocol) -> None:
+    direct_low = _knowledge(protocol, "linker", A2AMessagePriority.LOW)
+    broadcast_high = _knowledge(protocol, "*", A2AMessagePriority.HIGH)
+    direct_high = _knowledge(protocol, "linker", A2AMessagePriority.HIGH)
+    for message in (direct_low, broadcast_high, direct_high):
+        await protocol.send_message(message)
+
+    messages = await protocol.get_messages_for_agent("linker")
+
+    assert [msg.message_id for msg in messages] == [
+        broadcast_high.message_id,
+        direct_high.message_id,
+        direct_low.message_id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_typed_signature_matches_dict_signature(protocol) -> None:
+    message = _knowledge(protocol, "linker")
+    await protocol.send_message(message)
+
+    security_service = protocol._security_service
+    message_dict = message.model_dump()
+
+    assert message.security.verified is True
+    assert message.security.signature == security_service.sign_message(message_dict)
+    assert security_service.validate_message_security(message_dict)["is_valid"]
+
+
+@pytest.mark.asyncio
+async def test_message_events_not_serialised_when_info_disabled(
+    protocol, caplog
+) -> None:
+    caplog.set_level(logging.WARNING, logger="backend.services.a2a_protocol")
+
+    with patch("backend.services.a2a_protocol.json") as protocol_json:
+        await protocol.send_message(_knowledge(protocol, "linker"))
+        await protocol.get_messages_for_agent("linker")
+
+    protocol_json.dumps.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_message_events_carry_structured_fields(protocol, caplog) -> None:
+    caplog.set_level(logging.INFO, logger="backend.services.a2a_protocol")
+
+    message = _knowledge(protocol, "linker")
+    await protocol.send_message(message)
+
+    events = [r for r in caplog.records if r.getMessage().startswith("A2A_EVENT")]
+    assert events[0].json_fields["a2a_protocol"]["message_id"] == message.message_id
+
+
+@pytest.mark.asyncio
+async def test_history_is_bounded_but_stats_keep_counting(
+    protocol, monkeypatch
+) -> None:
+    from collections import deque
+
+    monkeypatch.setattr(protocol, "_message_history", deque(maxlen=2))
+    for _ in range(3):
+        await protocol.send_message(_knowledge(protocol, "linker"))
+
+    stats = protocol.get_protocol_stats()
+
+    assert len(protocol.get_message_history()) == 2
+    assert stats["total_messages"] == 3
+    assert stats["message_types"] == {"knowledge_transfer": 3}
+    assert stats["agent_activity"] == {"orchestrator": 3}
+
+
+def test_signature_matches_fresh_hmac(protocol) -> None:
+    import hashlib
+    import hmac
+
+    import orjson
+
+    security_service = protocol._security_service
+    message_dict = {"message_id": "msg-1", "from_agent": "linker", "data": {"a": 1}}
+    canonical = orjson.dumps(
+        {
+            "message_id": "msg-1",
+            "from_agent": "linker",
+            "to_agent": None,
+            "message_type": None,
+            "timestamp": None,
+            "data": {"a": 1},
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    expected = hmac.new(
+        security_service._secret_key.encode("utf-8"),
+        canonical,
+        hashlib.sha256,
+    ).hexdigest()
+
+    # Signing twice must not leak state between messages via the template
+    assert security_service.sign_message(message_dict) == expected
+    assert security_service.sign_message(message_dict) == expected
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_each_subscriber(protocol) -> None:
+    protocol.subscribe_agent("linker", ["knowledge_transfer"])
+    protocol.subscribe_agent("visualizer", ["knowledge_transfer", "status"])
+
+    await protocol.broadcast_message(_knowledge(protocol, "*"))
+
+    linker_messages = await protocol.get_messages_for_agent("linker")
+    visualizer_messages = await protocol.get_messages_for_agent("visualizer")
+
+    assert [msg.to_agent for msg in linker_messages] == ["linker"]
+    assert [msg.to_agent for msg in visualizer_messages] == ["visualizer"]
+    assert linker_messages[0].security.signature != (
+        visualizer_messages[0].security.signature
+    )
+    assert await protocol.get_messages_for_agent("summarizer") == []
+
+
+def test_cloud_run_identity_fetched_once(monkeypatch) -> None:
+    from unittest.mock import MagicMock
+
+    from backend.services import a2a_security
+    from backend.services.a2a_security import ServiceAccountIdentity
+
+    session = MagicMock()
+    session.get.return_value.text = "value\n"
+    monkeypatch.setenv("K_SERVICE", "agentnav-backend")
+    monkeypatch.setattr(a2a_security, "_cached_identity", None)
+    monkeypatch.setattr(a2a_security, "_metadata_session", session)
+
+    first = ServiceAccountIdentity.from_cloud_run_metadata()
+    second = ServiceAccountIdentity.from_cloud_run_metadata()
+
+    assert first is second
+    assert first.email == "value"
+    assert session.get.call_count == 3
+
+
+def test_concurrent_identity_lookups_share_one_fetch(monkeypatch) -> None:
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import MagicMock
+
+    from backend.services import a2a_security
+    from backend.services.a2a_security import ServiceAccountIdentity
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.01)
+        return MagicMock(text="value")
+
+    session = MagicMock()
+    session.get.side_effect = slow_get
+    monkeypatch.setenv("K_SERVICE", "agentnav-backend")
+    monkeypatch.setattr(a2a_security, "_cached_identity", None)
+    monkeypatch.setattr(a2a_security, "_identity_lock", threading.Lock())
+    monkeypatch.setattr(a2a_security, "_metadata_session", session)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        identities = list(
+            pool.map(
+                lambda _: ServiceAccountIdentity.from_cloud_run_metadata(), range(8)
+            )
+        )
+
+    assert all(identity is identities[0] for identity in identities)
+    assert session.get.call_count == 3
+
+
+def test_canonical_form_is_sorted_json(protocol) -> None:
+    import hashlib
+    import hmac
+
+    import orjson
+
+    security_service = protocol._security_service
+    message_dict = {
+        "message_id": "msg-ü",
+        "from_agent": "linker",
+        "to_agent": "*",
+        "message_type": "knowledge_transfer",
+        "timestamp": 1699999999.25,
+        "data": {"z": [1, None, True], "a": {"nested": 'naïve "quoted"'}},
+    }
+    canonical = orjson.dumps(message_dict, option=orjson.OPT_SORT_KEYS)
+    expected = hmac.new(
+        security_service._secret_key.encode("utf-8"),
+        canonical,
+        hashlib.sha256,
+    ).hexdigest()
+
+    assert security_service.sign_message(message_dict) == expected
+
+
+def test_verify_rejects_tampered_and_malformed_signatures(protocol) -> None:
+    security_service = protocol._security_service
+    message_dict = {"message_id": "msg-1", "from_agent": "linker", "data": {"a": 1}}
+    signature = security_service.sign_message(message_dict)
+    tampered = ("0" if signature[0] != "0" else "1") + signature[1:]
+
+    assert security_service.verify_message_signature(message_dict, signature)
+    assert not security_service.verify_message_signature(message_dict, tampered)
+    assert not security_service.verify_message_signature(message_dict, "not-hex")
+
+
+def test_batch_signatures_match_single_signatures(protocol) -> None:
+    security_service = protocol._security_service
+    message_dicts = [
+        {"message_id": f"msg-{i}", "from_agent": "linker", "data": {"i": i}}
+        for i in range(3)
+    ]
+
+    assert security_service.sign_messages_batch(message_dicts) == [
+        security_service.sign_message(message_dict) for message_dict in message_dicts
+    ]
+
+
+def test_pbkdf2_only_stretches_the_signing_key(monkeypatch) -> None:
+    import hashlib
+    import hmac
+
+    import orjson
+
+    from backend.services import a2a_security
+    from backend.services.a2a_security import A2ASecurityService
+
+    monkeypatch.setenv("A2A_USE_PBKDF2", "true")
+    monkeypatch.setenv("A2A_PBKDF2_ITERATIONS", "10")
+    security_service = A2ASecurityService()
+    message_dict = {"message_id": "msg-1", "from_agent": "linker", "data": {}}
+    derived_key = hashlib.pbkdf2_hmac(
+        "sha256",
+        security_service._secret_key.encode("utf-8"),
+        a2a_security._PBKDF2_SALT,
+        iterations=10,
+    )
+    canonical = orjson.dumps(
+        {**message_dict, "to_agent": None, "message_type": None, "timestamp": None},
+        option=orjson.OPT_SORT_KEYS,
+    )
+
+    with patch.object(hashlib, "pbkdf2_hmac") as pbkdf2:
+        signature = security_service.sign_message(message_dict)
+
+    pbkdf2.assert_not_called()
+    assert signature == hmac.new(derived_key, canonical, hashlib.sha256).hexdigest()
+
+
+def test_redelivered_message_reuses_verification_result(protocol) -> None:
+    security_service = protocol._security_service
+    message_dict = {"message_id": "msg-1", "from_agent": "linker", "data": {"a": 1}}
+    signature = security_service.sign_message(message_dict)
+
+    assert security_service.verify_message_signature(message_dict, signature)
+    with patch.object(security_service, "_hmac_template") as template:
+        assert security_service.verify_message_signature(message_dict, signature)
+        assert not security_service.verify_message_signature(
+            {**message_dict, "data": {"a": 2}}, signature
+        )
+
+    # Only the tampered message needed a fresh HMAC
+    assert template.copy.call_count == 1
+
+
+def test_security_log_redacts_nested_sensitive_fields(protocol) -> None:
+    security_service = protocol._security_service
+    event = {
+        "message_id": "msg-1",
+        "Signature": "abc",
+        "data": {"API_KEY": "k", "items": [{"auth_header": "h", "n": 1}, 2]},
+    }
+
+    assert security_service._sanitize_for_logging(event) == {
+        "message_id": "msg-1",
+        "Signature": "[REDACTED]",
+        "data": {
+            "API_KEY": "[REDACTED]",
+            "items": [{"auth_header": "[REDACTED]", "n": 1}, 2],
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_security_events_written_off_the_verification_path(
+    protocol, caplog
+) -> None:
+    import asyncio
+
+    caplog.set_level(logging.WARNING, logger="backend.services.a2a_security")
+    security_service = protocol._security_service
+    message_dict = {"message_id": "msg-1", "from_agent": "linker", "data": {}}
+
+    assert not security_service.verify_message_signature(message_dict, "00")
+    assert "SECURITY EVENT" not in caplog.text
+
+    await asyncio.sleep(0)
+
+    assert "SECURITY EVENT: signature_verification_failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_aclose_writes_queued_security_events(protocol, caplog) -> None:
+    caplog.set_level(logging.WARNING, logger="backend.services.a2a_security")
+    security_service = protocol._security_service
+    message_dict = {"message_id": "msg-1", "from_agent": "linker", "data": {}}
+
+    assert not security_service.verify_message_signature(message_dict, "00")
+    drain_task = security_service._audit_task
+    await security_service.aclose()
+
+    assert "SECURITY EVENT: signature_verification_failed" in caplog.text
+    assert drain_task.cancelled()
+    assert security_service._audit_task is None
+
+
+def test_message_signed_by_this_service_is_not_re_signed(protocol) -> None:
+    security_service = protocol._security_service
+    message_dict = {"message_id": "msg-1", "from_agent": "linker", "data": {}}
+
+    security_service.enhance_message_with_security(message_dict)
+    with patch.object(security_service, "_canonical_digest") as canonical_digest:
+        security_service.enhance_message_with_security(message_dict)
+
+    canonical_digest.assert_not_called()
+    assert message_dict["security"]["signature_algorithm"] == "HMAC-SHA256"
+
+
+def test_message_edited_after_signing_is_signed_again(protocol) -> None:
+    security_service = protocol._security_service
+    message_dict = {
+        "message_id": "msg-1",
+        "from_agent": "linker",
+        "to_agent": "visualizer",
+        "data": {"entities": ["a"]},
+    }
+
+    security_service.enhance_message_with_security(message_dict)
+    first_signature = message_dict["security"]["signature"]
+
+    message_dict["data"] = {"entities": ["a", "b"]}
+    message_dict["to_agent"] = "orchestrator"
+    security_service.enhance_message_with_security(message_dict)
+
+    assert message_dict["security"]["signature"] != first_signature
+    assert security_service.verify_message_signature(
+        message_dict, message_dict["security"]["signature"]
+    )
+
+
+def test_agent_authorization_rules(protocol) -> None:
+    security_service = protocol._security_service
+    account = security_service.identity.email
+
+    assert security_service.authorize_agent_communication(
+        "linker", "summarizer", account
+    )
+    assert security_service.authorize_agent_communication("unknown", "*", account)
+    assert not security_service.authorize_agent_communication(
+        "unknown", "linker", account
+    )
+
+
+def test_batch_validation_authenticates_each_account_once(protocol) -> None:
+    security_service = protocol._security_service
+    message_dicts = [
+        security_service.enhance_message_with_security(
+            {
+                "message_id": f"msg-{i}",
+                "from_agent": "orchestrator",
+                "to_agent": "linker",
+                "message_type": "status",
+                "timestamp": time.time(),
+                "data": {},
+            }
+        )
+        for i in range(3)
+    ]
+
+    with patch.object(
+        security_service,
+        "authenticate_service_account",
+        wraps=security_service.authenticate_service_account,
+    ) as authenticate:
+        results = security_service.validate_message_security_batch(message_dicts)
+
+    assert authenticate.call_count == 1
+    assert results == [
+        {
+            **security_service.validate_message_security(m),
+            "validated_at": r["validated_at"],
+        }
+        for m, r in zip(message_dicts, results)
+    ]
+    assert all(result["is_valid"] for result in results)
@@ -0,0 +1,197 @@
+"""Firestore persistence of SessionContext."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.models.context_model import SessionContext
+from backend.services import context_persistence
+from backend.services.context_persistence import ContextPersistenceService
+
+
+@pytest.fixture
+def firestore_client() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def persistence(firestore_client) -> ContextPersistenceService:
+    return ContextPersistenceService(firestore_client=firestore_client)
+
+
+def _context(session_id: str, workflow_status: str = "initializing"):
+    return SessionContext(
+        session_id=session_id,
+        raw_input="Test document",
+        content_type="document",
+        workflow_status=workflow_status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_saves_are_coalesced_into_one_batch(
+    persistence, firestore_client, monkeypatch
+) -> None:
+    monkeypatch.setattr(context_persistence, "SAVE_DEBOUNCE_SECONDS", 0)
+    batch = firestore_client.client.batch.return_value
+
+    await persistence.save_context(_context("session-a"))
+    await persistence.save_context(_context("session-a", "completed"))
+    await persistence.save_context(_context("session-b"))
+    await asyncio.sleep(0.01)
+
+    batch.commit.assert_called_once()
+    written = {
+        call.args[1]["session_id"]: call.args[1]["workflow_status"]
+        for call in batch.set.call_args_list
+    }
+    assert written == {"session-a": "completed", "session-b": "initializing"}
+
+
+@pytest.mark.asyncio
+async def test_unflushed_save_is_visible_to_load_as_a_copy(
+    persistence, firestore_client
+) -> None:
+    context = _context("session-a")
+
+    await persistence.save_context(context)
+
+    loaded = await persistence.load_context("session-a")
+    loaded.summary_text = "changed by caller"
+
+    assert loaded.session_id == "session-a"
+    assert persistence._pending["session-a"].summary_text is None
+    firestore_client.get_document.return_value.get.assert_not_called()
+
+    assert await persistence.flush()
+    firestore_client.client.batch.return_value.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_repeat_loads_served_from_cache_until_saved(
+    persistence, firestore_client
+) -> None:
+    doc = firestore_client.get_document.return_value.get.return_value
+    doc.exists = True
+    doc.to_dict.side_effect = lambda: _context("session-a").to_firestore_dict()
+
+    first = await persistence.load_context("session-a")
+    first.summary_text = "changed by caller"
+    second = await persistence.load_context("session-a")
+
+    assert doc.to_dict.call_count == 1
+    assert second.summary_text is None
+
+    await persistence.save_context(_context("session-a", "completed"))
+    await persistence.flush()
+    await persistence.load_context("session-a")
+
+    assert doc.to_dict.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_contexts_fetches_document_names_only(
+    persistence, firestore_client
+) -> None:
+    query = firestore_client.get_collection.return_value.order_by.return_value
+    docs = [MagicMock(id="session-a"), MagicMock(id="session-b")]
+    query.select.return_value.limit.return_value.stream.return_value = iter(docs)
+
+    assert await persistence.list_contexts(limit=2) == ["session-a", "session-b"]
+    query.select.assert_called_once_with(["__name__"])
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_contexts_pending(
+    persistence, firestore_client, monkeypatch
+) -> None:
+    monkeypatch.setattr(context_persistence, "FLUSH_RETRY_SECONDS", 60)
+    batch = firestore_client.client.batch.return_value
+    batch.commit.side_effect = RuntimeError("unavailable")
+
+    await persistence.save_context(_context("session-a"))
+    await persistence.save_context(_context("session-b"))
+    assert not await persistence.flush()
+    assert set(persistence._pending) == {"session-a", "session-b"}
+    assert persistence._flush_handle is not None
+
+    # A newer save made while the commit failed is not overwritten
+    await persistence.save_context(_context("session-a", "completed"))
+    batch.commit.side_effect = None
+    assert await persistence.aclose()
+
+    written = {
+        call.args[1]["session_id"]: call.args[1]["workflow_status"]
+        for call in batch.set.call_args_list[-2:]
+    }
+    assert written == {"session-a": "completed", "session-b": "initializing"}
+    assert not persistence._pending
+    assert persistence._flush_handle is None
+
+
+@pytest.mark.asyncio
+async def test_scheduled_flush_task_is_kept_and_awaited_on_close(
+    persistence, firestore_client, monkeypatch
+) -> None:
+    monkeypatch.setattr(context_persistence, "SAVE_DEBOUNCE_SECONDS", 0)
+
+    await persistence.save_context(_context("session-a"))
+    await asyncio.sleep(0.01)
+
+    assert persistence._flush_task is not None
+    assert await persistence.aclose()
+    firestore_client.client.batch.return_value.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_overlapping_flushes_commit_in_order(
+    persistence, firestore_client
+) -> None:
+    import threading
+
+    first_commit_started = threading.Event()
+    release_first_commit = threading.Event()
+    commits_started = []
+    committed = []
+
+    def batch():
+        writes = []
+        mock = MagicMock()
+        mock.set.side_effect = lambda ref, data: writes.append(data["workflow_status"])
+
+        def commit():
+            commits_started.append(writes)
+            if len(commits_started) == 1:
+                first_commit_started.set()
+                release_first_commit.wait(timeout=5)
+            committed.append(writes)
+
+        mock.commit.side_effect = commit
+        return mock
+
+    firestore_client.client.batch.side_effect = batch
+    doc = firestore_client.get_document.return_value.get.return_value
+
+    await persistence.save_context(_context("session-a", "in_progress"))
+    first_flush = asyncio.create_task(persistence.flush())
+    await asyncio.to_thread(first_commit_started.wait, 5)
+
+    # The in-flight context is served without reading the old document
+    loaded = await persistence.load_context("session-a")
+    assert loaded.workflow_status == "in_progress"
+    doc.to_dict.assert_not_called()
+
+    await persistence.save_context(_context("session-a", "completed"))
+    second_flush = asyncio.create_task(persistence.flush())
+    delete = asyncio.create_task(persistence.delete_context("session-b"))
+    await asyncio.sleep(0.01)
+    firestore_client.get_document.return_value.delete.assert_not_called()
+
+    release_first_commit.set()
+    assert await first_flush and await second_flush and await delete
+
+    assert committed == [["in_progress"], ["completed"]]
+    assert not persistence._flushing
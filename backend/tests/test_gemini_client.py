@@ -0,0 +1,194 @@
+"""Tests for the Gemini client wrapper."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from google.genai.types import GenerateContentConfig
+
+from backend.services import gemini_client
+from backend.services.gemini_client import GeminiClient
+
+
+@pytest.fixture(autouse=True)
+def _clear_reasoning_cache():
+    gemini_client._reasoning_cache.clear()
+    yield
+    gemini_client._reasoning_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_generate_awaits_native_async_client() -> None:
+    response = SimpleNamespace(text="async answer")
+    generate_content = AsyncMock(return_value=response)
+    sdk_client = MagicMock()
+    sdk_client.aio.models.generate_content = generate_content
+
+    result = await GeminiClient(client=sdk_client).generate(
+        model="gemini-test", prompt="hello", max_tokens=32, temperature=0.5
+    )
+
+    assert result is response
+    generate_content.assert_awaited_once_with(
+        model="gemini-test",
+        contents="hello",
+        config=GenerateContentConfig(max_output_tokens=32, temperature=0.5),
+    )
+    sdk_client.models.generate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_sdk_calls_run_on_dedicated_pool() -> None:
+    import threading
+
+    def generate(**kwargs):
+        return threading.current_thread().name
+
+    sdk_client = SimpleNamespace(models=SimpleNamespace(generate=generate))
+
+    thread_name = await GeminiClient(client=sdk_client).generate(
+        model="gemini-test", prompt="hello"
+    )
+
+    assert thread_name.startswith("genai")
+
+
+def test_client_without_generate_api_fails_at_construction() -> None:
+    with pytest.raises(RuntimeError, match="Unsupported"):
+        GeminiClient(client=SimpleNamespace())
+
+
+@pytest.mark.asyncio
+async def test_generate_reuses_config_for_same_settings() -> None:
+    sdk_client = MagicMock()
+    sdk_client.aio.models.generate_content = AsyncMock()
+    client = GeminiClient(client=sdk_client)
+
+    await client.generate(model="gemini-test", prompt="a", max_tokens=64)
+    await client.generate(model="gemini-test", prompt="b", max_tokens=64)
+    await client.generate(model="gemini-test", prompt="c", max_tokens=64, top_p=0.9)
+
+    first, second, third = (
+        call.kwargs["config"]
+        for call in sdk_client.aio.models.generate_content.await_args_list
+    )
+    assert first is second
+    assert third == {"max_output_tokens": 64, "temperature": 0.0, "top_p": 0.9}
+
+
+@pytest.mark.asyncio
+async def test_reason_with_gemini_returns_response_text(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sdk_client = MagicMock()
+    sdk_client.aio.models.generate_content = AsyncMock(
+        return_value=SimpleNamespace(text="reasoned")
+    )
+    monkeypatch.setattr(
+        gemini_client, "get_gemini_client", lambda: GeminiClient(client=sdk_client)
+    )
+
+    assert await gemini_client.reason_with_gemini("prompt") == "reasoned"
+
+
+@pytest.mark.asyncio
+async def test_reason_with_gemini_caches_deterministic_calls_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    generate_content = AsyncMock(return_value=SimpleNamespace(text="answer"))
+    sdk_client = MagicMock()
+    sdk_client.aio.models.generate_content = generate_content
+    monkeypatch.setattr(
+        gemini_client, "get_gemini_client", lambda: GeminiClient(client=sdk_client)
+    )
+
+    for _ in range(2):
+        assert await gemini_client.reason_with_gemini("same prompt") == "answer"
+    assert generate_content.await_count == 1
+
+    for _ in range(2):
+        await gemini_client.reason_with_gemini("same prompt", temperature=0.7)
+    assert generate_content.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_with_gemini_yields_chunks_as_they_arrive(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def chunks():
+        for text in ("Hel", "", "lo"):
+            yield SimpleNamespace(text=text)
+
+    sdk_client = MagicMock()
+    sdk_client.aio.models.generate_content_stream = AsyncMock(return_value=chunks())
+    monkeypatch.setattr(
+        gemini_client, "get_gemini_client", lambda: GeminiClient(client=sdk_client)
+    )
+
+    fragments = [
+        fragment async for fragment in gemini_client.stream_with_gemini("prompt")
+    ]
+
+    assert fragments == ["Hel", "lo"]
+    sdk_client.aio.models.generate_content.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_to_single_chunk_without_streaming_api() -> None:
+    sdk_client = SimpleNamespace(
+        models=SimpleNamespace(generate=lambda **kwargs: "whole answer")
+    )
+
+    chunks = [
+        chunk
+        async for chunk in GeminiClient(client=sdk_client).generate_stream(
+            model="gemini-test", prompt="hello"
+        )
+    ]
+
+    assert chunks == ["whole answer"]
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        (SimpleNamespace(text="from sdk"), "from sdk"),
+        ("plain", "plain"),
+        ({"candidates": [{"content": {"text": "nested"}}]}, "nested"),
+        ({"outputs": [{"output": {"content": "legacy"}}]}, "legacy"),
+        (SimpleNamespace(text=None), "namespace(text=None)"),
+    ],
+)
+def test_response_text_normalizes_sdk_shapes(result, expected) -> None:
+    assert gemini_client._response_text(result, max_tokens=16) == expected
+
+
+def test_sdk_client_is_built_with_transient_retries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from google import genai
+
+    client_ctor = MagicMock()
+    monkeypatch.setattr(
+        gemini_client,
+        "_load_genai",
+        lambda: SimpleNamespace(Client=client_ctor, types=genai.types),
+    )
+
+    GeminiClient()
+
+    retry_options = client_ctor.call_args.kwargs["http_options"].retry_options
+    assert retry_options.attempts == gemini_client.GEMINI_RETRY_ATTEMPTS
+    assert 429 in retry_options.http_status_codes
+    assert 400 not in retry_options.http_status_codes
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_async_and_sync_connections() -> None:
+    sdk_client = MagicMock()
+    sdk_client.aio.aclose = AsyncMock()
+
+    await GeminiClient(client=sdk_client).aclose()
+
+    sdk_client.aio.aclose.assert_awaited_once()
+    sdk_client.close.assert_called_once()
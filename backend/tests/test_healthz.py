@@ -0,0 +1,40 @@
+"""Health check endpoints."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend import main
+
+
+@pytest.fixture(autouse=True)
+def _clear_healthz_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(main, "_healthz_cache", None)
+
+
+@pytest.fixture
+def get_agents_module(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    get_agents_module = MagicMock(return_value=(MagicMock(), None))
+    monkeypatch.setattr(main, "_get_agents_module", get_agents_module)
+    return get_agents_module
+
+
+@pytest.mark.asyncio
+async def test_healthz_reuses_recent_healthy_result(get_agents_module) -> None:
+    first = await main.healthz_check()
+    second = await main.healthz_check()
+
+    assert first.status == "healthy"
+    assert second is first
+    assert get_agents_module.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_healthz_recomputes_degraded_results(get_agents_module) -> None:
+    get_agents_module.return_value = (None, ImportError("missing"))
+
+    first = await main.healthz_check()
+    await main.healthz_check()
+
+    assert first.status == "unhealthy"
+    assert get_agents_module.call_count == 2
@@ -0,0 +1,217 @@
+"""Firestore-backed knowledge cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.knowledge_cache_service import (
+    CONTENT_HASH_VERSION,
+    KnowledgeCacheService,
+)
+
+
+@pytest.fixture
+def firestore_client() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def cache_service(firestore_client) -> KnowledgeCacheService:
+    return KnowledgeCacheService(firestore_client=firestore_client)
+
+
+def _stored_doc(firestore_client: MagicMock, **fields) -> MagicMock:
+    doc_ref = firestore_client.get_document.return_value
+    doc = doc_ref.get.return_value
+    doc.exists = True
+    doc.to_dict.return_value = {
+        "summary": "cached summary",
+        "expires_at": time.time() + 3600,
+        **fields,
+    }
+    return doc_ref
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_records_hit_on_same_reference(
+    cache_service, firestore_client
+) -> None:
+    doc_ref = _stored_doc(firestore_client)
+
+    result = await cache_service.check_cache("content")
+    await asyncio.gather(*cache_service._pending_writes)
+
+    assert result["summary"] == "cached summary"
+    firestore_client.get_document.assert_called_once()
+    doc_ref.update.assert_called_once()
+    assert "hit_count" in doc_ref.update.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_cache_lookup_without_recording_hit(
+    cache_service, firestore_client
+) -> None:
+    doc_ref = _stored_doc(firestore_client)
+
+    assert await cache_service.check_cache("content", record_hit=False)
+
+    assert not cache_service._pending_writes
+    doc_ref.update.assert_not_called()
+
+
+def _expired_queries(firestore_client, timestamp_pages, legacy_pages):
+    """Route expiry queries to separate mocks by the filter value's type"""
+    from datetime import datetime
+
+    queries = {datetime: MagicMock(), float: MagicMock()}
+    queries[datetime].stream.side_effect = timestamp_pages
+    queries[float].stream.side_effect = legacy_pages
+    collection = firestore_client.get_collection.return_value
+    collection.where.side_effect = lambda field, op, value: MagicMock(
+        **{"select.return_value.limit.return_value": queries[type(value)]}
+    )
+    return queries
+
+
+@pytest.mark.asyncio
+async def test_cleanup_drains_expired_entries_a_batch_per_page(
+    cache_service, firestore_client
+) -> None:
+    expired = [MagicMock(), MagicMock(), MagicMock()]
+    _expired_queries(firestore_client, [expired[:2], expired[2:]], [[]])
+    batch = firestore_client.client.batch.return_value
+
+    assert await cache_service.cleanup_expired_entries(batch_size=2) == 3
+
+    assert batch.delete.call_count == 3
+    assert batch.commit.call_count == 2
+    for doc in expired:
+        doc.reference.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_also_deletes_legacy_epoch_second_entries(
+    cache_service, firestore_client
+) -> None:
+    legacy = MagicMock()
+    queries = _expired_queries(firestore_client, [[]], [[legacy]])
+    batch = firestore_client.client.batch.return_value
+
+    assert await cache_service.cleanup_expired_entries() == 1
+
+    queries[float].stream.assert_called_once()
+    batch.delete.assert_called_once_with(legacy.reference)
+    batch.commit.assert_called_once()
+
+
+def test_content_hash_separates_content_types(cache_service) -> None:
+    document_hash = cache_service.generate_content_hash("text", "document")
+
+    assert document_hash == cache_service.generate_content_hash("text", "document")
+    assert document_hash != cache_service.generate_content_hash("text", "codebase")
+    assert len(document_hash) == 64
+
+
+@pytest.mark.asyncio
+async def test_repeat_lookups_are_served_from_memory(
+    cache_service, firestore_client
+) -> None:
+    doc_ref = _stored_doc(firestore_client)
+
+    first = await cache_service.check_cache("content", record_hit=False)
+    first["summary"] = "changed by caller"
+    second = await cache_service.check_cache("content", record_hit=False)
+
+    assert second["summary"] == "cached summary"
+    doc_ref.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stored_and_deleted_entries_update_local_cache(
+    cache_service, firestore_client
+) -> None:
+    doc_ref = firestore_client.get_document.return_value
+    doc_ref.get.return_value.exists = False
+
+    visualization_data = {"nodes": []}
+    await cache_service.store_cache(
+        "content", "document", "summary", visualization_data
+    )
+    visualization_data["nodes"].append("changed by caller")
+    cached = await cache_service.check_cache("content", record_hit=False)
+    assert cached["summary"] == "summary"
+    assert cached["visualization_data"] == {"nodes": []}
+    doc_ref.get.assert_not_called()
+
+    await cache_service.delete_cache_entry(
+        cache_service.generate_content_hash("content", "document")
+    )
+    assert await cache_service.check_cache("content", record_hit=False) is None
+    doc_ref.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_fetch_only_counted_fields(
+    cache_service, firestore_client
+) -> None:
+    entry = MagicMock()
+    entry.to_dict.return_value = {"hit_count": 4, "expires_at": time.time() - 1}
+    collection = firestore_client.get_collection.return_value
+    collection.select.return_value.limit.return_value.stream.return_value = [entry]
+
+    stats = await cache_service.get_cache_stats()
+
+    collection.select.assert_called_once_with(["expires_at", "hit_count"])
+    assert stats["total_hits"] == 4
+    assert stats["expired_entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_on_a_timestamp(cache_service, firestore_client) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    doc_ref = firestore_client.get_document.return_value
+    await cache_service.store_cache("content", "document", "summary", {})
+    expires_at = doc_ref.set.call_args.args[0]["expires_at"]
+    assert isinstance(expires_at, datetime)
+
+    cache_service._local_cache.clear()
+    _stored_doc(
+        firestore_client, expires_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+    )
+    assert await cache_service.check_cache("content") is None
+    doc_ref.delete.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_purge_removes_unversioned_and_older_hash_entries(
+    cache_service, firestore_client
+) -> None:
+    pages = {
+        "expires_at": [[MagicMock(), MagicMock()]],
+        "hash_version": [[MagicMock()]],
+    }
+    collection = firestore_client.get_collection.return_value
+    collection.where.side_effect = lambda field, op, value: MagicMock(
+        **{"select.return_value.limit.return_value.stream.side_effect": pages[field]}
+    )
+
+    assert await cache_service.purge_legacy_entries() == 3
+
+    where_calls = [call.args for call in collection.where.call_args_list]
+    assert ("expires_at", "<", float("inf")) in where_calls
+    assert ("hash_version", "<", CONTENT_HASH_VERSION) in where_calls
+
+
+@pytest.mark.asyncio
+async def test_stored_entries_record_hash_version(
+    cache_service, firestore_client
+) -> None:
+    await cache_service.store_cache("content", "document", "summary", {})
+
+    stored = firestore_client.get_document.return_value.set.call_args.args[0]
+    assert stored["hash_version"] == CONTENT_HASH_VERSION
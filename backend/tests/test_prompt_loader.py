@@ -0,0 +1,48 @@
+"""Tests for the prompt loader's batched Firestore reads."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.prompt_loader import PromptLoaderService
+
+
+def _snapshot(doc_id: str, prompt_text=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=doc_id,
+        exists=prompt_text is not None,
+        to_dict=lambda: {"prompt_text": prompt_text},
+    )
+
+
+@pytest.fixture
+def loader(monkeypatch: pytest.MonkeyPatch) -> PromptLoaderService:
+    firestore_client = MagicMock()
+    monkeypatch.setattr(
+        "backend.services.prompt_loader.get_firestore_client",
+        lambda: firestore_client,
+    )
+    return PromptLoaderService()
+
+
+def test_get_prompts_reads_cache_misses_in_one_batch(loader) -> None:
+    loader.cache.set("cached", "from cache")
+    loader.firestore_client.get_documents.return_value = [
+        _snapshot("a", "prompt a"),
+        _snapshot("missing"),
+        _snapshot("empty", ""),
+    ]
+
+    prompts = loader.get_prompts(["cached", "a", "missing", "empty"])
+
+    assert prompts == {"cached": "from cache", "a": "prompt a"}
+    (keys,) = loader.firestore_client.get_documents.call_args.args
+    assert list(keys) == [
+        ("agent_prompts", "a"),
+        ("agent_prompts", "missing"),
+        ("agent_prompts", "empty"),
+    ]
+    # Loaded prompts are cached for later single lookups
+    assert loader.get_prompt("a") == "prompt a"
+    loader.firestore_client.get_document.assert_not_called()
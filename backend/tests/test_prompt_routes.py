@@ -1,5 +1,8 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
+import pytest
+from cachetools import TTLCache
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -17,6 +20,17 @@ def create_app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def suggestion_cache(monkeypatch: pytest.MonkeyPatch) -> TTLCache:
+    """Give each test an empty suggestion cache, restored afterwards"""
+    cache: TTLCache = TTLCache(
+        maxsize=prompt_routes.SUGGESTION_CACHE_MAXSIZE,
+        ttl=prompt_routes.SUGGESTION_CACHE_TTL_SECONDS,
+    )
+    monkeypatch.setattr(prompt_routes, "_suggestion_cache", cache)
+    return cache
+
+
 def test_suggest_prompt_requires_body():
     app = create_app()
     client = TestClient(app)
@@ -44,3 +58,88 @@ def test_suggest_prompt_returns_suggestions():
     assert response.status_code == 200
     data = response.json()
     assert data["suggestions"] == ["Improved prompt", "Another prompt"]
+
+
+def test_suggest_prompt_strips_bullets_and_blank_lines():
+    app = create_app()
+    client = TestClient(app)
+
+    fake_response = "* First prompt  \n\n   \n• Second prompt\r\nThird prompt"
+
+    with patch(
+        "backend.services.gemini_client.reason_with_gemini",
+        new=AsyncMock(return_value=fake_response),
+    ):
+        response = client.post(
+            "/api/prompt-assistant/suggest",
+            json={"prompt": "Test prompt", "max_suggestions": 3},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["suggestions"] == [
+        "First prompt",
+        "Second prompt",
+        "Third prompt",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_prompts_share_one_llm_call():
+    release = asyncio.Event()
+
+    async def _slow_generate(**_):
+        await release.wait()
+        return "- Shared prompt"
+
+    generate = AsyncMock(side_effect=_slow_generate)
+
+    pending = [
+        asyncio.create_task(prompt_routes._coalesced_generate("same", generate))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*pending) == ["- Shared prompt"] * 3
+    assert generate.await_count == 1
+    assert "same" not in prompt_routes._inflight_suggestions
+
+
+def test_repeat_prompt_served_from_cache(suggestion_cache):
+    app = create_app()
+    client = TestClient(app)
+
+    generate = AsyncMock(return_value="- Cached prompt")
+    payload = {"prompt": "Test prompt", "max_suggestions": 1}
+
+    with patch("backend.services.gemini_client.reason_with_gemini", new=generate):
+        first = client.post("/api/prompt-assistant/suggest", json=payload)
+        second = client.post("/api/prompt-assistant/suggest", json=payload)
+
+    assert first.json()["suggestions"] == second.json()["suggestions"]
+    assert second.json()["suggestions"] == ["Cached prompt"]
+    assert generate.await_count == 1
+    assert len(suggestion_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_after_all_waiters_cancel_is_logged(caplog):
+    release = asyncio.Event()
+
+    async def _failing_generate(**_):
+        await release.wait()
+        raise RuntimeError("gemini down")
+
+    waiter = asyncio.create_task(
+        prompt_routes._coalesced_generate("abandoned", _failing_generate)
+    )
+    await asyncio.sleep(0)
+    future = prompt_routes._inflight_suggestions["abandoned"]
+    waiter.cancel()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.wait({future})
+
+    assert "abandoned" not in prompt_routes._inflight_suggestions
+    assert "Prompt suggestion failed: gemini down" in caplog.text
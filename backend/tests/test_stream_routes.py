@@ -9,6 +9,8 @@ https://github.com/stevei101/agentnav/issues/285.
 from __future__ import annotations
 
 import asyncio
+import json
+import logging
 from typing import Dict
 from unittest.mock import AsyncMock
 
@@ -39,13 +41,10 @@ def stubbed_workflow(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
 def fixed_session_id(monkeypatch: pytest.MonkeyPatch) -> str:
     """Force a deterministic session identifier for assertions."""
 
-    class _DeterministicUUID:
-        hex = "feedfacecafe123456789abc"
-
     session_id = "session_feedfacecafe"
     monkeypatch.setattr(
-        "backend.routes.stream_routes.uuid.uuid4",
-        lambda: _DeterministicUUID(),
+        "backend.routes.stream_routes.secrets.token_hex",
+        lambda nbytes: "feedfacecafe",
         raising=False,
     )
     return session_id
@@ -162,6 +161,22 @@ class TestEventModelValidation:
         assert payload.error.error_type is ErrorType.WORKFLOW_ERROR
         assert payload.error.recoverable is False
 
+    def test_event_factories_match_validated_events(self) -> None:
+        from backend.models.stream_event_model import (
+            AgentStreamEvent,
+            AgentTypeEnum,
+            create_agent_processing_event,
+        )
+
+        event = create_agent_processing_event(
+            agent="summarizer", step=2, elapsed_ms=10, partial_results={"k": "v"}
+        )
+        validated = AgentStreamEvent.model_validate(event.model_dump())
+
+        assert event.agent is AgentTypeEnum.SUMMARIZER
+        assert event.id.startswith("evt_")
+        assert event.model_dump(mode="json") == validated.model_dump(mode="json")
+
 
 class TestEventStreaming:
     """Event emitter behaviour."""
@@ -186,7 +201,9 @@ class TestEventStreaming:
             }
         )
 
-        queued_event = await asyncio.wait_for(client_queue.get(), timeout=1.0)
+        (queued_event,) = json.loads(
+            await asyncio.wait_for(client_queue.get(), timeout=1.0)
+        )
         assert queued_event["id"] == "evt-001"
         assert queued_event["agent"] == "summarizer"
 
@@ -207,9 +224,11 @@ class TestEventStreaming:
             }
         )
 
-        event1 = await asyncio.wait_for(queue1.get(), timeout=1.0)
-        event2 = await asyncio.wait_for(queue2.get(), timeout=1.0)
-        assert event1["id"] == event2["id"] == "evt-002"
+        batch1 = await asyncio.wait_for(queue1.get(), timeout=1.0)
+        batch2 = await asyncio.wait_for(queue2.get(), timeout=1.0)
+        # Serialised once and shared by every client
+        assert batch1 is batch2
+        assert json.loads(batch1)[0]["id"] == "evt-002"
 
     @pytest.mark.asyncio
     async def test_client_unregistration(self, emitter_factory) -> None:
@@ -229,12 +248,226 @@ class TestEventStreaming:
             }
         )
 
-        event2 = await asyncio.wait_for(queue2.get(), timeout=1.0)
+        (event2,) = json.loads(await asyncio.wait_for(queue2.get(), timeout=1.0))
         assert event2["id"] == "evt-003"
 
         with pytest.raises(asyncio.TimeoutError):
             await asyncio.wait_for(queue1.get(), timeout=0.25)
 
+    @pytest.mark.asyncio
+    async def test_back_to_back_events_delivered_as_one_batch(
+        self, emitter_factory
+    ) -> None:
+        emitter = emitter_factory("test-session-batch")
+        client_queue: asyncio.Queue = asyncio.Queue()
+        emitter.register_client(client_queue)
+
+        for status in ("queued", "processing", "complete"):
+            await emitter.emit_event({"agent": "summarizer", "status": status})
+
+        batch = json.loads(await asyncio.wait_for(client_queue.get(), timeout=1.0))
+        assert [event["status"] for event in batch] == [
+            "queued",
+            "processing",
+            "complete",
+        ]
+        assert client_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_emitters_run_no_background_tasks(self, emitter_factory) -> None:
+        tasks_before = len(asyncio.all_tasks())
+        for session_id in ("idle-1", "idle-2"):
+            emitter = emitter_factory(session_id)
+            emitter.register_client(asyncio.Queue())
+            await emitter.emit_event({"agent": "summarizer", "status": "queued"})
+
+        assert len(asyncio.all_tasks()) == tasks_before
+
+    def test_session_logger_keeps_caller_extra(
+        self, emitter_factory, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        emitter = emitter_factory("test-session-logging")
+        caplog.set_level(logging.INFO, logger="backend.services.event_emitter")
+
+        emitter.logger.info(
+            "tagged", extra={"attempt": 2, "json_fields": {"agent": "linker"}}
+        )
+
+        record = caplog.records[-1]
+        assert record.getMessage() == "[test-session-logging] tagged"
+        assert record.attempt == 2
+        assert record.json_fields == {
+            "session_id": "test-session-logging",
+            "agent": "linker",
+        }
+
+    @pytest.mark.asyncio
+    async def test_lagging_client_is_told_about_dropped_events(
+        self, emitter_factory
+    ) -> None:
+        emitter = emitter_factory("test-session-full")
+        slow_client: asyncio.Queue = asyncio.Queue(maxsize=1)
+        emitter.register_client(slow_client)
+
+        for status in ("queued", "processing", "complete"):
+            await emitter.emit_event({"agent": "summarizer", "status": status})
+            emitter.flush()
+
+        # Queue full: the client stays registered, the later batches are dropped
+        assert slow_client in emitter.connected_clients
+        assert emitter.get_stats()["dropped_events"] == 2
+        (first,) = json.loads(slow_client.get_nowait())
+        assert first["metadata"]["seq"] == 1
+
+        await emitter.emit_event({"agent": "linker", "status": "queued"})
+        emitter.flush()
+
+        gap, event = json.loads(slow_client.get_nowait())
+        assert gap == {"type": "gap", "dropped_events": 2}
+        assert event["metadata"]["seq"] == 4
+
+    @pytest.mark.asyncio
+    async def test_event_history_keeps_most_recent_events(
+        self, monkeypatch: pytest.MonkeyPatch, emitter_factory
+    ) -> None:
+        from collections import deque
+
+        emitter = emitter_factory("test-session-history")
+        monkeypatch.setattr(emitter, "events_emitted", deque(maxlen=2))
+
+        for status in ("queued", "processing", "complete"):
+            await emitter.emit_event({"agent": "summarizer", "status": status})
+
+        history = emitter.get_event_history()
+        assert [event["status"] for event in history] == ["processing", "complete"]
+        stats = emitter.get_stats()
+        assert stats["total_events"] == 3
+        # Breakdowns cover the whole session, not just the retained history
+        assert stats["status_breakdown"] == {
+            "queued": 1,
+            "processing": 1,
+            "complete": 1,
+        }
+        assert stats["agent_breakdown"] == {"summarizer": 3}
+
+    @pytest.mark.asyncio
+    async def test_session_stats_include_serialized_history(
+        self, emitter_factory
+    ) -> None:
+        from backend.routes.stream_routes import get_session_stats
+
+        emitter = emitter_factory("test-session-detail")
+        for status in ("queued", "complete"):
+            await emitter.emit_event({"agent": "linker", "status": status})
+
+        body = json.loads((await get_session_stats("test-session-detail")).body)
+
+        assert body["session_id"] == "test-session-detail"
+        assert body["stats"]["total_events"] == 2
+        assert body["events"] == emitter.get_event_history()
+
+    def test_cleanup_removes_only_expired_emitters(self, event_emitter_manager) -> None:
+        event_emitter_manager.create_emitter("old-session")
+        event_emitter_manager.create_emitter("recreated-session")
+        event_emitter_manager.remove_emitter("recreated-session")
+        event_emitter_manager.create_emitter("recreated-session")
+
+        assert event_emitter_manager.cleanup_inactive_emitters() == 0
+        # A negative age puts every live emitter past the cutoff; the stale
+        # heap entry for the removed emitter is skipped
+        assert event_emitter_manager.cleanup_inactive_emitters(max_age_ms=-1000) == 2
+        assert event_emitter_manager.emitters == {}
+
+    @pytest.mark.asyncio
+    async def test_stream_stats_served_from_snapshot(
+        self, event_emitter_manager, emitter_factory
+    ) -> None:
+        from backend.routes.stream_routes import get_stream_stats
+
+        emitter_factory("test-session-stats")
+
+        first = await get_stream_stats()
+        second = await get_stream_stats()
+
+        assert first.body is second.body
+        body = json.loads(first.body)
+        assert body["active_sessions"] == 1
+        assert "test-session-stats" in body["sessions"]
+
+        emitter_factory("test-session-stats-2")
+        refreshed = json.loads((await get_stream_stats()).body)
+        assert refreshed["active_sessions"] == 2
+
+
+class TestServerSentEvents:
+    """SSE variant of the workflow stream."""
+
+    def test_sse_streams_emitted_events(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        event_emitter_manager,
+        workflow_request_payload,
+    ) -> None:
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from backend.routes.stream_routes import router
+
+        async def _fake_workflow(session_id, document, content_type, emitter):
+            for status in ("processing", "complete"):
+                await emitter.emit_event({"agent": "summarizer", "status": status})
+
+        monkeypatch.setattr(
+            "backend.routes.stream_routes._execute_stream_workflow", _fake_workflow
+        )
+
+        app = FastAPI()
+        app.include_router(router)
+        response = TestClient(app).post(
+            "/api/v1/navigate/sse", json=workflow_request_payload
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [
+            event
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+            for event in json.loads(line[len("data: ") :])
+        ]
+        assert [frame["status"] for frame in frames] == ["processing", "complete"]
+        assert not event_emitter_manager.emitters
+
+    @pytest.mark.asyncio
+    async def test_sse_disconnect_leaves_no_pending_tasks(
+        self, monkeypatch: pytest.MonkeyPatch, event_emitter_manager
+    ) -> None:
+        from types import SimpleNamespace
+
+        from backend.routes.stream_routes import _stream_workflow_events
+
+        async def _stalled_workflow(session_id, document, content_type, emitter):
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(
+            "backend.routes.stream_routes._execute_stream_workflow", _stalled_workflow
+        )
+        before = asyncio.all_tasks()
+
+        stream = _stream_workflow_events(
+            "sse-disconnect", SimpleNamespace(document="doc", content_type="document")
+        )
+        reader = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0)
+        # Client disconnects while the generator is waiting on the queue
+        reader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await reader
+        await asyncio.sleep(0)
+
+        assert asyncio.all_tasks() - before == set()
+        assert not event_emitter_manager.emitters
+
 
 class TestAgentEventEmission:
     """Agent-level streaming hooks."""
@@ -258,7 +491,7 @@ class TestAgentEventEmission:
         stub_external_services["gemini"].assert_awaited()
         stub_external_services["firestore"].get_document.assert_called()
 
-        statuses = {event.status for event in emitter.events_emitted}
+        statuses = {status for status, _, _ in emitter.events_emitted}
         assert AgentStatusEnum.PROCESSING in statuses
         assert AgentStatusEnum.COMPLETE in statuses
 
@@ -274,7 +507,7 @@ class TestAgentEventEmission:
         with pytest.raises(ValueError):
             await agent.process({"content_type": "document"})
 
-        assert emitter.events_emitted == []
+        assert not emitter.events_emitted
 
 
 class TestErrorHandling:
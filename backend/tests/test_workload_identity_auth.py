@@ -1,10 +1,17 @@
+import base64
+import json
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 
-from backend.services.workload_identity_auth import verify_workload_identity
+from backend.services.workload_identity_auth import (
+    _CertsCachingRequest,
+    _trusted_service_accounts,
+    verify_workload_identity,
+)
 
 
 def create_app(dep=Depends(verify_workload_identity)):
@@ -22,7 +29,18 @@ def clear_env(monkeypatch):
     monkeypatch.delenv("REQUIRE_WI_AUTH", raising=False)
     monkeypatch.delenv("TRUSTED_SERVICE_ACCOUNTS", raising=False)
     monkeypatch.delenv("EXPECTED_AUDIENCE", raising=False)
+    _trusted_service_accounts.cache_clear()
     yield
+    _trusted_service_accounts.cache_clear()
+
+
+def _unsigned_token(claims):
+    def _segment(data):
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    header = _segment(json.dumps({"alg": "RS256", "typ": "JWT"}).encode())
+    payload = _segment(json.dumps(claims).encode())
+    return f"{header}.{payload}.{_segment(b'signature')}"
 
 
 def test_auth_not_required_when_disabled(monkeypatch):
@@ -83,6 +101,27 @@ def test_token_rejected_if_email_not_trusted(monkeypatch):
     assert response.status_code == 403
 
 
+def test_untrusted_email_rejected_before_signature_check(monkeypatch):
+    monkeypatch.setenv("REQUIRE_WI_AUTH", "true")
+    monkeypatch.setenv(
+        "TRUSTED_SERVICE_ACCOUNTS", "trusted@project.iam.gserviceaccount.com"
+    )
+
+    app = create_app()
+    client = TestClient(app)
+    token = _unsigned_token({"email": "intruder@project.iam.gserviceaccount.com"})
+
+    with patch(
+        "backend.services.workload_identity_auth.id_token.verify_oauth2_token"
+    ) as verify:
+        response = client.get(
+            "/protected", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert response.status_code == 403
+    verify.assert_not_called()
+
+
 def test_token_allows_trusted_service_account(monkeypatch):
     monkeypatch.setenv("REQUIRE_WI_AUTH", "true")
     monkeypatch.setenv(
@@ -107,3 +146,16 @@ def test_token_allows_trusted_service_account(monkeypatch):
     body = response.json()
     assert body["authenticated"] is True
     assert body["email"] == "trusted@project.iam.gserviceaccount.com"
+
+
+def test_certs_transport_reuses_successful_get_responses():
+    transport = _CertsCachingRequest()
+    ok = SimpleNamespace(status=200, data=b"{}")
+
+    with patch(
+        "google.auth.transport.requests.Request.__call__", return_value=ok
+    ) as fetch:
+        assert transport("https://certs.example", method="GET") is ok
+        assert transport("https://certs.example", method="GET") is ok
+
+    assert fetch.call_count == 1
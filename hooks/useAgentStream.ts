@@ -69,23 +69,37 @@ export const useAgentStream = ({
 
       ws.onmessage = event => {
         try {
-          const data = JSON.parse(event.data);
-
-          // Validate event structure
-          if (data.id && data.agent && data.status && data.timestamp) {
-            const streamEvent: AgentStreamEvent = {
-              id: data.id,
-              agent: data.agent as AgentName,
-              status: data.status as AgentEventType,
-              timestamp: data.timestamp,
-              metadata: data.metadata,
-              payload: data.payload,
-            };
-
-            setEvents(prev => [...prev, streamEvent]);
-            onEvent?.(streamEvent);
-          } else {
-            console.warn('Invalid event structure:', data);
+          const parsed = JSON.parse(event.data);
+
+          // Events emitted back to back arrive batched in one JSON array frame
+          const frames = Array.isArray(parsed) ? parsed : [parsed];
+          const streamEvents: AgentStreamEvent[] = [];
+
+          for (const data of frames) {
+            // The server dropped events while this client lagged behind
+            if (data.type === 'gap') {
+              console.warn(`Missed ${data.dropped_events} stream events`);
+              continue;
+            }
+
+            // Validate event structure
+            if (data.id && data.agent && data.status && data.timestamp) {
+              streamEvents.push({
+                id: data.id,
+                agent: data.agent as AgentName,
+                status: data.status as AgentEventType,
+                timestamp: data.timestamp,
+                metadata: data.metadata,
+                payload: data.payload,
+              });
+            } else {
+              console.warn('Invalid event structure:', data);
+            }
+          }
+
+          if (streamEvents.length > 0) {
+            setEvents(prev => [...prev, ...streamEvents]);
+            streamEvents.forEach(streamEvent => onEvent?.(streamEvent));
           }
         } catch (err) {
           console.error('Failed to parse WebSocket message:', err);
@@ -15,3 +15,14 @@ resource "google_firestore_database" "main" {
   depends_on = [google_project_service.apis]
 }
 
+
+# Server-side TTL for the knowledge cache: Firestore deletes entries in the
+# background (typically within 24h) once their expires_at timestamp passes
+resource "google_firestore_field" "knowledge_cache_ttl" {
+  project    = var.project_id
+  database   = google_firestore_database.main.name
+  collection = "knowledge_cache"
+  field      = "expires_at"
+
+  ttl_config {}
+}